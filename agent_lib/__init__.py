@@ -7,6 +7,7 @@ from .core import (
     BaseAgent,
     AgentConfig,
     AgentStatus,
+    TaskResult,
     Tool,
     BaseTool,
     FunctionTool,
@@ -27,6 +28,7 @@ __all__ = [
     "BaseAgent",
     "AgentConfig",
     "AgentStatus",
+    "TaskResult",
     "Tool",
     "BaseTool",
     "FunctionTool",
@@ -4,7 +4,7 @@ This module provides the foundational classes and utilities for building
 scalable, secure, and observable agent systems.
 """
 
-from .agent import BaseAgent, AgentConfig, AgentStatus
+from .agent import BaseAgent, AgentConfig, AgentStatus, TaskResult
 from .tool import (
     BaseTool,
     FunctionTool,
@@ -22,6 +22,7 @@ __all__ = [
     "BaseAgent",
     "AgentConfig",
     "AgentStatus",
+    "TaskResult",
     "Tool",
     "BaseTool",
     "FunctionTool",
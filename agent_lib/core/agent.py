@@ -4,16 +4,105 @@ This module provides the foundational BaseAgent class that all agents should inh
 along with configuration models and status tracking for enterprise deployment.
 """
 
+import os
+import json
+import time
 import uuid
+import queue
+import atexit
 import asyncio
 import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Union, Set, Tuple, ClassVar
 from datetime import datetime, timezone
 
 from pydantic import BaseModel, Field, validator
-from tenacity import retry, stop_after_attempt, wait_exponential
+
+# orjson is optional; it serializes results, datetimes included, in one C pass
+try:
+	import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+	_orjson = None
+
+
+# Bound once so the per-task level check skips the attribute lookup
+_LOGGER_INFO = logging.INFO
+
+# Agent loggers enqueue records; a background listener thread does the writes
+_log_queue: Optional[queue.SimpleQueue] = None
+_log_listener: Optional[QueueListener] = None
+_log_lock = threading.Lock()
+
+
+def _start_log_listener(log_queue: queue.SimpleQueue) -> QueueListener:
+	"""Start a listener thread writing records from ``log_queue`` to stderr."""
+	handler = logging.StreamHandler()
+	handler.setFormatter(logging.Formatter(
+		'%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+	))
+	listener = QueueListener(log_queue, handler)
+	listener.start()
+	return listener
+
+
+def _stop_log_listener() -> None:
+	"""Drain pending records and stop the current listener."""
+	if _log_listener is not None:
+		_log_listener.stop()
+
+
+def _agent_log_queue() -> queue.SimpleQueue:
+	"""Return the shared agent log queue, starting its listener on first use."""
+	global _log_queue, _log_listener
+	with _log_lock:
+		if _log_queue is None:
+			log_queue = queue.SimpleQueue()
+			_log_listener = _start_log_listener(log_queue)
+			# Drain pending records before the interpreter exits
+			atexit.register(_stop_log_listener)
+			_log_queue = log_queue
+	return _log_queue
+
+
+def _restart_log_listener_in_child() -> None:
+	"""Give a forked child its own listener for the inherited queue.
+    
+	The listener thread does not survive ``fork()``, while the queue and the
+	QueueHandlers pointing at it do; without a new thread every record the
+	child logs would pile up unwritten.
+	"""
+	global _log_lock, _log_listener
+	_log_lock = threading.Lock()
+	if _log_queue is None:
+		return
+	# Records the parent had queued are the parent's to write
+	while True:
+		try:
+			_log_queue.get_nowait()
+		except queue.Empty:
+			break
+	_log_listener = _start_log_listener(_log_queue)
+
+
+if hasattr(os, "register_at_fork"):
+	os.register_at_fork(after_in_child=_restart_log_listener_in_child)
+
+
+class _AgentLoggerAdapter(logging.LoggerAdapter):
+	"""Logger adapter that stamps every record with the agent's identity.
+    
+	Unlike the stock adapter, call-site ``extra`` fields are merged with the
+	bound context instead of replacing it.
+	"""
+    
+	def process(self, msg: Any, kwargs: Any) -> Any:
+		extra = kwargs.get("extra")
+		kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+		return msg, kwargs
 
 
 class AgentStatus(str, Enum):
@@ -27,6 +116,19 @@ class AgentStatus(str, Enum):
 	MAINTENANCE = "maintenance"
 
 
+# Statuses in which an agent is running and accepts work
+_HEALTHY_STATUSES = frozenset({AgentStatus.READY, AgentStatus.BUSY})
+
+
+_SUPPORTED_MODELS = frozenset({
+	"gpt-4", "gpt-4-turbo", "gpt-3.5-turbo",
+	"claude-3-sonnet", "claude-3-haiku",
+	"gemini-pro", "llama-2-70b"
+})
+
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
 class AgentConfig(BaseModel):
 	"""Configuration model for agent initialization and behavior.
     
@@ -55,7 +157,8 @@ class AgentConfig(BaseModel):
     
 	# Security Settings
 	enable_security: bool = Field(default=True, description="Enable security features")
-	allowed_domains: List[str] = Field(default_factory=list, description="Allowed domains for external calls")
+	# A tuple keeps the frozen config hashable, so it can key the agent pool
+	allowed_domains: Tuple[str, ...] = Field(default_factory=tuple, description="Allowed domains for external calls")
 	rate_limit_per_minute: int = Field(default=60, gt=0, description="Rate limit per minute")
     
 	# Observability
@@ -66,22 +169,17 @@ class AgentConfig(BaseModel):
 	@validator("model_name")
 	def validate_model_name(cls, v):
 		"""Validate supported model names."""
-		supported_models = [
-			"gpt-4", "gpt-4-turbo", "gpt-3.5-turbo",
-			"claude-3-sonnet", "claude-3-haiku",
-			"gemini-pro", "llama-2-70b"
-		]
-		if v not in supported_models:
-			raise ValueError(f"Model {v} not supported. Supported models: {supported_models}")
+		if v not in _SUPPORTED_MODELS:
+			raise ValueError(f"Model {v} not supported. Supported models: {sorted(_SUPPORTED_MODELS)}")
 		return v
     
 	@validator("log_level")
 	def validate_log_level(cls, v):
 		"""Validate logging level."""
-		valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-		if v.upper() not in valid_levels:
-			raise ValueError(f"Invalid log level: {v}. Valid levels: {valid_levels}")
-		return v.upper()
+		level = v.upper()
+		if level not in _VALID_LOG_LEVELS:
+			raise ValueError(f"Invalid log level: {v}. Valid levels: {sorted(_VALID_LOG_LEVELS)}")
+		return level
     
 	class Config:
 		"""Pydantic configuration."""
@@ -90,15 +188,20 @@ class AgentConfig(BaseModel):
 		use_enum_values = True
 
 
-class AgentMetrics(BaseModel):
-	"""Agent performance and operational metrics."""
+@dataclass(slots=True)
+class AgentMetrics:
+	"""Agent performance and operational metrics.
+    
+	A plain dataclass rather than a pydantic model: the counters are written
+	after every task, and attribute writes here skip model validation.
+	"""
     
-	tasks_completed: int = Field(default=0, description="Total tasks completed")
-	tasks_failed: int = Field(default=0, description="Total tasks failed")
-	average_execution_time: float = Field(default=0.0, description="Average execution time in seconds")
-	memory_usage_mb: float = Field(default=0.0, description="Current memory usage in MB")
-	cpu_usage_percent: float = Field(default=0.0, description="Current CPU usage percentage")
-	last_activity: Optional[datetime] = Field(default=None, description="Last activity timestamp")
+	tasks_completed: int = 0  # Total tasks completed
+	tasks_failed: int = 0  # Total tasks failed
+	average_execution_time: float = 0.0  # Average execution time in seconds
+	memory_usage_mb: float = 0.0  # Current memory usage in MB
+	cpu_usage_percent: float = 0.0  # Current CPU usage percentage
+	last_activity: Optional[datetime] = None  # Last activity timestamp
     
 	@property
 	def success_rate(self) -> float:
@@ -107,6 +210,62 @@ class AgentMetrics(BaseModel):
 		return (self.tasks_completed / total_tasks * 100) if total_tasks > 0 else 0.0
 
 
+@dataclass(slots=True, frozen=True)
+class TaskResult:
+	"""Outcome of a single ``BaseAgent.execute`` call.
+    
+	Fields can also be read by key (``result["success"]``), as with the dict
+	``execute`` used to return; call ``as_dict()`` where a real dict is needed.
+	``timestamp`` is kept as a datetime and only formatted by ``to_json()``.
+	"""
+    
+	task_id: str
+	result: Any
+	success: bool
+	execution_time: float
+	agent_id: str
+	timestamp: datetime
+    
+	def __getitem__(self, key: str) -> Any:
+		if key not in _TASK_RESULT_FIELDS:
+			raise KeyError(key)
+		return getattr(self, key)
+    
+	def __contains__(self, key: object) -> bool:
+		return key in _TASK_RESULT_FIELDS
+    
+	def as_dict(self) -> Dict[str, Any]:
+		"""Return the result as a plain dictionary."""
+		return {
+			"task_id": self.task_id,
+			"result": self.result,
+			"success": self.success,
+			"execution_time": self.execution_time,
+			"agent_id": self.agent_id,
+			"timestamp": self.timestamp
+		}
+    
+	def to_json(self) -> bytes:
+		"""Serialize the result to JSON, using orjson when it is installed.
+        
+		Raises:
+			TypeError: If the task result holds a value JSON cannot represent
+		"""
+		if _orjson is not None:
+			return _orjson.dumps(self.as_dict())
+		return json.dumps(self.as_dict(), default=_json_default).encode()
+
+
+def _json_default(value: Any) -> Any:
+	"""Encode datetimes for the stdlib JSON fallback."""
+	if isinstance(value, datetime):
+		return value.isoformat()
+	raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_TASK_RESULT_FIELDS = frozenset(TaskResult.__slots__)
+
+
 class BaseAgent(ABC):
 	"""Abstract base class for all agent implementations.
     
@@ -128,6 +287,38 @@ class BaseAgent(ABC):
 		```
 	"""
     
+	# Fixed attribute layout; subclasses that do not declare __slots__ still
+	# get a __dict__ for their own attributes
+	__slots__ = (
+		"config",
+		"_config_dict",
+		"_config_summary",
+		"_health_static",
+		"agent_id",
+		"status",
+		"metrics",
+		"_timed_task_count",
+		"created_at",
+		"_created_monotonic",
+		"last_error",
+		"logger",
+		"_log_info",
+		"_execute_task_call",
+		"_running_tasks",
+		"_shutdown_event",
+		"_task_semaphore",
+		"_slot_waiters",
+		"_no_slot_waiters",
+		"__weakref__",
+	)
+    
+	# Agents reused by get_or_create, keyed by concrete class, config and the
+	# event loop they run on; least recently used entries go first
+	_agent_pool: ClassVar[Dict[
+		Tuple[type, AgentConfig, Optional[asyncio.AbstractEventLoop]], "BaseAgent"
+	]] = {}
+	_agent_pool_size: ClassVar[int] = 32
+    
 	def __init__(self, config: AgentConfig) -> None:
 		"""Initialize agent with configuration.
         
@@ -139,46 +330,105 @@ class BaseAgent(ABC):
 			RuntimeError: If initialization fails
 		"""
 		self.config = config
+		# The config is frozen, so its serialized forms are built once
+		self._config_dict = config.model_dump()
+		self._config_summary = {
+			"model": config.model_name,
+			"max_concurrent_tasks": config.max_concurrent_tasks,
+			"timeout_seconds": config.timeout_seconds
+		}
 		self.agent_id = str(uuid.uuid4())
+		# Health fields that never change after construction
+		self._health_static = {"agent_id": self.agent_id, "name": config.name}
 		self.status = AgentStatus.INITIALIZING
 		self.metrics = AgentMetrics()
+		# Number of executions folded into average_execution_time
+		self._timed_task_count = 0
 		self.created_at = datetime.now(timezone.utc)
+		self._created_monotonic = time.monotonic()
 		self.last_error: Optional[str] = None
         
 		# Setup logging
 		self.logger = self._setup_logging()
         
 		# Initialize components
-		self._running_tasks: Dict[str, asyncio.Task] = {}
+		# In-flight task executions; each removes itself when done
+		self._running_tasks: Set[asyncio.Task] = set()
 		self._shutdown_event = asyncio.Event()
+		# Bounds concurrent execute() calls; BUSY means every slot is taken
+		self._task_semaphore = asyncio.Semaphore(config.max_concurrent_tasks)
+		# Calls queued for a slot; shutdown waits until they have been turned away
+		self._slot_waiters = 0
+		self._no_slot_waiters = asyncio.Event()
+		self._no_slot_waiters.set()
         
 		# Complete initialization
 		self._post_init()
+		# Bound once after _post_init so per-task calls skip the method lookup
+		self._execute_task_call = self._execute_task
+		self._log_info = self.logger.info
 		self.status = AgentStatus.READY
         
 		self.logger.info(
-			f"Agent {self.config.name} ({self.agent_id}) initialized successfully",
-			extra={
-				"agent_id": self.agent_id,
-				"agent_name": self.config.name,
-				"config": self.config.dict()
-			}
+			"Agent %s (%s) initialized successfully",
+			self.config.name,
+			self.agent_id,
+			extra={"config": self._config_dict}
 		)
     
-	def _setup_logging(self) -> logging.Logger:
-		"""Setup structured logging for the agent."""
+	@classmethod
+	def get_or_create(cls, config: AgentConfig) -> "BaseAgent":
+		"""Return a pooled agent for ``config``, constructing it on first use.
+        
+		Intended for workers that would otherwise build a new agent for every
+		task with the same configuration. Agents that have been shut down or
+		put into an error state are replaced.
+        
+		An agent's semaphore and events belong to the event loop that first
+		waits on them, so agents are pooled per running loop; call this from
+		inside the loop that will use the agent (e.g. each ``asyncio.run``).
+		Entries for closed loops are dropped, and beyond ``_agent_pool_size``
+		the least recently used agent is evicted.
+        
+		Args:
+			config: Agent configuration parameters
+            
+		Returns:
+			Agent instance of this class bound to ``config``
+		"""
+		try:
+			loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+		except RuntimeError:
+			loop = None
+		pool = cls._agent_pool
+		key = (cls, config, loop)
+		agent = pool.pop(key, None)
+		if agent is None or not agent.is_healthy:
+			for stale in [k for k in pool if k[2] is not None and k[2].is_closed()]:
+				del pool[stale]
+			while len(pool) >= cls._agent_pool_size:
+				del pool[next(iter(pool))]
+			agent = cls(config)
+		# Reinserted so dict order tracks recency
+		pool[key] = agent
+		return agent
+    
+	def _setup_logging(self) -> logging.LoggerAdapter:
+		"""Setup structured logging for the agent.
+        
+		Returns:
+			Adapter that adds ``agent_id`` and ``agent_name`` to every record
+		"""
 		logger = logging.getLogger(f"agent.{self.config.name}")
 		logger.setLevel(getattr(logging, self.config.log_level))
         
 		if not logger.handlers:
-			handler = logging.StreamHandler()
-			formatter = logging.Formatter(
-				'%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-			)
-			handler.setFormatter(formatter)
-			logger.addHandler(handler)
+			# Stream writes happen on the listener thread, not the event loop
+			logger.addHandler(QueueHandler(_agent_log_queue()))
         
-		return logger
+		return _AgentLoggerAdapter(
+			logger, {"agent_id": self.agent_id, "agent_name": self.config.name}
+		)
     
 	def _post_init(self) -> None:
 		"""Post-initialization hook for subclasses to override."""
@@ -187,22 +437,19 @@ class BaseAgent(ABC):
 	@property
 	def is_healthy(self) -> bool:
 		"""Check if agent is in a healthy state."""
-		return self.status in [AgentStatus.READY, AgentStatus.BUSY]
+		return self.status in _HEALTHY_STATUSES
     
 	@property
 	def can_accept_tasks(self) -> bool:
-		"""Check if agent can accept new tasks."""
-		return (
-			self.status == AgentStatus.READY and
-			len(self._running_tasks) < self.config.max_concurrent_tasks
-		)
+		"""Check if agent can start a new task without waiting."""
+		return self.is_healthy and not self._task_semaphore.locked()
     
 	async def execute(
 		self, 
 		task: str, 
 		context: Optional[Dict[str, Any]] = None,
 		priority: int = 0
-	) -> Dict[str, Any]:
+	) -> TaskResult:
 		"""Execute a task with comprehensive error handling and observability.
         
 		Args:
@@ -211,67 +458,97 @@ class BaseAgent(ABC):
 			priority: Task priority (higher values = higher priority)
             
 		Returns:
-			Dictionary containing result and execution metadata
+			TaskResult holding the result and execution metadata
             
+		Tasks beyond ``max_concurrent_tasks`` wait for a free slot instead of
+		being rejected.
+        
 		Raises:
 			AgentExecutionError: If task execution fails
-			AgentBusyError: If agent cannot accept new tasks
+			AgentBusyError: If agent is not running (stopped, error or maintenance),
+				including when it stops while the call waits for a slot
 			AgentTimeoutError: If execution exceeds timeout
 		"""
-		if not self.can_accept_tasks:
+		if not self.is_healthy:
 			raise AgentBusyError(f"Agent {self.config.name} cannot accept new tasks")
         
-		task_id = str(uuid.uuid4())
-		start_time = datetime.now(timezone.utc)
+		# Hex form skips the dashed string formatting of str(uuid)
+		task_id = uuid.uuid4().hex
         
-		self.logger.info(
-			f"Starting task execution: {task_id}",
-			extra={
-				"task_id": task_id,
-				"task": task,
-				"context": context,
-				"priority": priority
-			}
-		)
+		if self._task_semaphore.locked():
+			await self._wait_for_slot()
+		else:
+			await self._task_semaphore.acquire()
+		# shutdown() may have run while this call waited for a slot
+		if not self.is_healthy:
+			self._task_semaphore.release()
+			raise AgentBusyError(f"Agent {self.config.name} cannot accept new tasks")
         
-		self.status = AgentStatus.BUSY
+		# Durations use the monotonic clock; the wall clock only stamps the result
+		start_monotonic = time.monotonic()
         
 		try:
-			# Execute task with timeout and retry logic
-			result = await self._execute_with_retry(task, context or {}, task_id)
+			if self._task_semaphore.locked():
+				self.status = AgentStatus.BUSY
+            
+			start_time = datetime.now(timezone.utc)
+            
+			# Per-task records are only assembled when INFO is enabled
+			log_info = self.logger.isEnabledFor(_LOGGER_INFO)
+			if log_info:
+				self._log_info(
+					"Starting task execution: %s",
+					task_id,
+					extra={
+						"task_id": task_id,
+						"task": task,
+						"context": context,
+						"priority": priority
+					}
+				)
+            
+			# Execute task with timeout and retry logic in a tracked child task,
+			# so shutdown can wait for or cancel exactly this work
+			work = asyncio.create_task(self._execute_with_retry(task, context or {}, task_id))
+			self._running_tasks.add(work)
+			work.add_done_callback(self._running_tasks.discard)
+			result = await work
             
 			# Update metrics
-			execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+			execution_time = time.monotonic() - start_monotonic
 			self.metrics.tasks_completed += 1
 			self.metrics.last_activity = datetime.now(timezone.utc)
 			self._update_average_execution_time(execution_time)
             
-			self.logger.info(
-				f"Task completed successfully: {task_id}",
-				extra={
-					"task_id": task_id,
-					"execution_time": execution_time,
-					"success": True
-				}
-			)
+			if log_info:
+				self._log_info(
+					"Task completed successfully: %s",
+					task_id,
+					extra={
+						"task_id": task_id,
+						"execution_time": execution_time,
+						"success": True
+					}
+				)
             
-			return {
-				"task_id": task_id,
-				"result": result,
-				"success": True,
-				"execution_time": execution_time,
-				"agent_id": self.agent_id,
-				"timestamp": start_time.isoformat()
-			}
+			return TaskResult(
+				task_id,
+				result,
+				True,
+				execution_time,
+				self.agent_id,
+				start_time
+			)
             
 		except Exception as e:
 			# Update error metrics
 			self.metrics.tasks_failed += 1
 			self.last_error = str(e)
-			execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+			execution_time = time.monotonic() - start_monotonic
             
 			self.logger.error(
-				f"Task execution failed: {task_id}",
+				"Task execution failed: %s",
+				task_id,
 				extra={
 					"task_id": task_id,
 					"error": str(e),
@@ -284,30 +561,83 @@ class BaseAgent(ABC):
 			raise AgentExecutionError(f"Task execution failed: {e}") from e
             
 		finally:
-			self.status = AgentStatus.READY
-			if task_id in self._running_tasks:
-				del self._running_tasks[task_id]
+			self._task_semaphore.release()
+			if self.status is AgentStatus.BUSY:
+				self.status = AgentStatus.READY
+    
+	async def _wait_for_slot(self) -> None:
+		"""Acquire a task slot, counted as a waiter until it is granted."""
+		self._slot_waiters += 1
+		self._no_slot_waiters.clear()
+		try:
+			await self._task_semaphore.acquire()
+		finally:
+			self._slot_waiters -= 1
+			if not self._slot_waiters:
+				self._no_slot_waiters.set()
+    
+	async def execute_many(
+		self,
+		tasks: List[str],
+		context: Optional[Dict[str, Any]] = None,
+		return_exceptions: bool = True,
+		max_in_flight: Optional[int] = None
+	) -> List[Union[TaskResult, BaseException]]:
+		"""Execute several tasks concurrently.
+        
+		Tasks share the agent's ``max_concurrent_tasks`` bound with every
+		other ``execute`` call; ``max_in_flight`` can lower it further for
+		this batch only.
+        
+		Args:
+			tasks: Task descriptions or instructions
+			context: Optional context information shared by all tasks
+			return_exceptions: Return failures in place of results instead of
+				raising the first one
+			max_in_flight: Optional per-batch concurrency limit
+            
+		Returns:
+			Results in the same order as ``tasks``
+		"""
+		if max_in_flight is None:
+			coroutines = [self.execute(task, context) for task in tasks]
+		else:
+			batch_semaphore = asyncio.Semaphore(max_in_flight)
+        
+			async def bounded(task: str) -> TaskResult:
+				async with batch_semaphore:
+					return await self.execute(task, context)
+        
+			coroutines = [bounded(task) for task in tasks]
+        
+		return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
     
-	@retry(
-		stop=stop_after_attempt(3),
-		wait=wait_exponential(multiplier=1, min=4, max=10)
-	)
 	async def _execute_with_retry(
 		self, 
 		task: str, 
 		context: Dict[str, Any],
 		task_id: str
 	) -> Dict[str, Any]:
-		"""Execute task with retry logic."""
-		try:
-			return await asyncio.wait_for(
-				self._execute_task(task, context),
-				timeout=self.config.timeout_seconds
-			)
-		except asyncio.TimeoutError:
-			raise AgentTimeoutError(
-				f"Task execution timed out after {self.config.timeout_seconds} seconds"
-			)
+		"""Execute task with retry logic.
+        
+		Makes up to ``retry_attempts + 1`` attempts, waiting 4s, 8s and then
+		10s between them; the last failure is re-raised unchanged.
+		"""
+		for attempt in range(self.config.retry_attempts + 1):
+			try:
+				async with asyncio.timeout(self.config.timeout_seconds):
+					return await self._execute_task_call(task, context)
+			except TimeoutError:
+				error = AgentTimeoutError(
+					f"Task execution timed out after {self.config.timeout_seconds} seconds"
+				)
+				if attempt == self.config.retry_attempts:
+					raise error
+			except Exception:
+				if attempt == self.config.retry_attempts:
+					raise
+        
+			await asyncio.sleep(min(10, 4 * 2 ** attempt))
     
 	@abstractmethod
 	async def _execute_task(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -329,15 +659,14 @@ class BaseAgent(ABC):
 		pass
     
 	def _update_average_execution_time(self, execution_time: float) -> None:
-		"""Update the rolling average execution time."""
-		total_tasks = self.metrics.tasks_completed + self.metrics.tasks_failed
-		if total_tasks == 1:
-			self.metrics.average_execution_time = execution_time
-		else:
-			# Simple moving average
-			self.metrics.average_execution_time = (
-				(self.metrics.average_execution_time * (total_tasks - 1) + execution_time) / total_tasks
-			)
+		"""Update the running average execution time.
+        
+		Uses the incremental mean ``avg += (x - avg) / n``, which avoids
+		re-scaling a running sum and stays stable over long-lived agents.
+		"""
+		self._timed_task_count += 1
+		average = self.metrics.average_execution_time
+		self.metrics.average_execution_time = average + (execution_time - average) / self._timed_task_count
     
 	async def health_check(self) -> Dict[str, Any]:
 		"""Perform comprehensive health check.
@@ -346,41 +675,47 @@ class BaseAgent(ABC):
 			Dictionary containing health status and metrics
 		"""
 		return {
-			"agent_id": self.agent_id,
-			"name": self.config.name,
+			**self._health_static,
 			"status": self.status.value,
 			"healthy": self.is_healthy,
 			"can_accept_tasks": self.can_accept_tasks,
-			"metrics": self.metrics.dict(),
-			"uptime_seconds": (datetime.now(timezone.utc) - self.created_at).total_seconds(),
+			"metrics": asdict(self.metrics),
+			"uptime_seconds": time.monotonic() - self._created_monotonic,
 			"running_tasks": len(self._running_tasks),
 			"last_error": self.last_error,
-			"configuration": {
-				"model": self.config.model_name,
-				"max_concurrent_tasks": self.config.max_concurrent_tasks,
-				"timeout_seconds": self.config.timeout_seconds
-			}
+			"configuration": dict(self._config_summary)
 		}
     
 	async def shutdown(self, graceful: bool = True) -> None:
 		"""Shutdown the agent gracefully or forcefully.
         
+		Calls still queued for a slot are rejected with ``AgentBusyError`` as
+		slots free up; shutdown returns once all of them have been turned away.
+        
 		Args:
-			graceful: If True, wait for running tasks to complete
+			graceful: If True, wait for running tasks to complete; otherwise
+				cancel them and wait for the cancellations to finish
 		"""
-		self.logger.info(f"Shutting down agent {self.config.name}")
+		self.logger.info("Shutting down agent %s", self.config.name)
 		self.status = AgentStatus.STOPPED
         
-		if graceful and self._running_tasks:
-			self.logger.info(f"Waiting for {len(self._running_tasks)} tasks to complete")
-			await asyncio.gather(*self._running_tasks.values(), return_exceptions=True)
-		else:
-			# Cancel all running tasks
-			for task in self._running_tasks.values():
-				task.cancel()
+		# Snapshot: finished tasks remove themselves from the live set
+		tasks = list(self._running_tasks)
+		if tasks:
+			if graceful:
+				self.logger.info("Waiting for %d tasks to complete", len(tasks))
+			else:
+				# Cancel all running tasks
+				for task in tasks:
+					task.cancel()
+			# wait() leaves task outcomes to their execute() callers
+			await asyncio.wait(tasks)
+        
+		# Each queued call wakes, sees STOPPED and hands its slot to the next
+		await self._no_slot_waiters.wait()
         
 		self._shutdown_event.set()
-		self.logger.info(f"Agent {self.config.name} shutdown complete")
+		self.logger.info("Agent %s shutdown complete", self.config.name)
     
 	def __repr__(self) -> str:
 		"""String representation of the agent."""
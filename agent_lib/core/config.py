@@ -5,13 +5,34 @@ environment variable support, and production-ready defaults for agent systems.
 """
 
 import os
-import json
-import yaml
+import copy
+import mmap
+import string
+import inspect
+import operator
+import functools
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Set, Mapping, get_args
 from enum import Enum
 
-from pydantic import BaseModel, Field, validator, root_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# orjson is an optional, faster drop-in for JSON config parsing
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+
+# Accepted database URL schemes
+_DB_SCHEMES = frozenset({"postgresql", "sqlite", "mysql", "redis"})
+
+# Accepted agent memory backends
+_MEMORY_BACKENDS = frozenset({"chromadb", "pinecone", "weaviate", "redis", "memory"})
+
+# Absolute paths of directories already created by SystemConfig in this process
+_ENSURED_DIRS: Set[str] = set()
 
 
 class LogLevel(str, Enum):
@@ -36,16 +57,20 @@ class DeploymentEnvironment(str, Enum):
 class DatabaseConfig(BaseModel):
     """Database configuration."""
     
+    model_config = ConfigDict(frozen=True)
+    
     url: str = Field(..., description="Database connection URL")
     pool_size: int = Field(default=10, ge=1, description="Connection pool size")
     max_overflow: int = Field(default=20, ge=0, description="Maximum pool overflow")
     pool_timeout: int = Field(default=30, ge=1, description="Pool timeout in seconds")
     echo: bool = Field(default=False, description="Enable SQL query logging")
     
-    @validator("url")
+    @field_validator("url")
+    @classmethod
     def validate_url(cls, v):
         """Validate database URL format."""
-        if not v.startswith(("postgresql://", "sqlite://", "mysql://", "redis://")):
+        scheme, sep, _ = v.partition("://")
+        if not sep or scheme not in _DB_SCHEMES:
             raise ValueError("Invalid database URL scheme")
         return v
 
@@ -53,6 +78,8 @@ class DatabaseConfig(BaseModel):
 class RedisConfig(BaseModel):
     """Redis configuration for caching and message queuing."""
     
+    model_config = ConfigDict(frozen=True)
+    
     host: str = Field(default="localhost", description="Redis host")
     port: int = Field(default=6379, ge=1, le=65535, description="Redis port")
     password: Optional[str] = Field(default=None, description="Redis password")
@@ -72,6 +99,8 @@ class RedisConfig(BaseModel):
 class SecurityConfig(BaseModel):
     """Security configuration."""
     
+    model_config = ConfigDict(frozen=True)
+    
     secret_key: str = Field(..., description="Secret key for encryption and signing")
     algorithm: str = Field(default="HS256", description="JWT signing algorithm")
     access_token_expire_minutes: int = Field(default=30, gt=0, description="Access token expiration")
@@ -88,7 +117,8 @@ class SecurityConfig(BaseModel):
     rate_limit_requests: int = Field(default=100, gt=0, description="Rate limit requests per window")
     rate_limit_window_minutes: int = Field(default=1, gt=0, description="Rate limit window in minutes")
     
-    @validator("secret_key")
+    @field_validator("secret_key")
+    @classmethod
     def validate_secret_key(cls, v):
         """Validate secret key strength."""
         if len(v) < 32:
@@ -99,6 +129,8 @@ class SecurityConfig(BaseModel):
 class ObservabilityConfig(BaseModel):
     """Observability and monitoring configuration."""
     
+    model_config = ConfigDict(frozen=True)
+    
     # Logging
     log_level: LogLevel = Field(default=LogLevel.INFO, description="Global log level")
     log_format: str = Field(default="json", description="Log format (json or text)")
@@ -122,6 +154,8 @@ class ObservabilityConfig(BaseModel):
 class AgentSystemConfig(BaseModel):
     """Agent system configuration."""
     
+    model_config = ConfigDict(frozen=True)
+    
     # Agent defaults
     default_model: str = Field(default="gpt-4", description="Default LLM model")
     default_temperature: float = Field(default=0.7, ge=0.0, le=2.0, description="Default temperature")
@@ -142,18 +176,20 @@ class AgentSystemConfig(BaseModel):
     tool_timeout: int = Field(default=60, gt=0, description="Default tool timeout in seconds")
     max_tool_retries: int = Field(default=2, ge=0, description="Maximum tool retry attempts")
     
-    @validator("memory_backend")
+    @field_validator("memory_backend")
+    @classmethod
     def validate_memory_backend(cls, v):
         """Validate memory backend options."""
-        valid_backends = ["chromadb", "pinecone", "weaviate", "redis", "memory"]
-        if v not in valid_backends:
-            raise ValueError(f"Invalid memory backend: {v}. Valid options: {valid_backends}")
+        if v not in _MEMORY_BACKENDS:
+            raise ValueError(f"Invalid memory backend: {v}. Valid options: {sorted(_MEMORY_BACKENDS)}")
         return v
 
 
 class APIConfig(BaseModel):
     """API server configuration."""
     
+    model_config = ConfigDict(frozen=True)
+    
     host: str = Field(default="0.0.0.0", description="API server host")
     port: int = Field(default=8000, ge=1024, le=65535, description="API server port")
     workers: int = Field(default=1, ge=1, description="Number of worker processes")
@@ -173,9 +209,17 @@ class APIConfig(BaseModel):
     openapi_url: Optional[str] = Field(default="/openapi.json", description="OpenAPI spec URL")
 
 
-class SystemConfig(BaseModel):
+class SystemConfig(BaseSettings):
     """Main system configuration."""
     
+    model_config = SettingsConfigDict(
+        env_prefix="AGENT_",
+        env_nested_delimiter="__",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True,
+    )
+    
     # Environment
     environment: DeploymentEnvironment = Field(default=DeploymentEnvironment.DEVELOPMENT)
     debug: bool = Field(default=False, description="Enable debug mode")
@@ -199,38 +243,143 @@ class SystemConfig(BaseModel):
     logs_directory: str = Field(default="./logs", description="Logs storage directory")
     cache_directory: str = Field(default="./cache", description="Cache storage directory")
     
-    @root_validator
-    def validate_production_settings(cls, values):
+    @model_validator(mode="after")
+    def validate_production_settings(self):
         """Validate production-specific settings."""
-        env = values.get("environment")
-        debug = values.get("debug")
-        
-        if env == DeploymentEnvironment.PRODUCTION:
-            if debug:
+        if self.environment == DeploymentEnvironment.PRODUCTION:
+            if self.debug:
                 raise ValueError("Debug mode must be disabled in production")
             
-            security = values.get("security")
-            if security and len(security.secret_key) < 64:
+            if self.security and len(self.security.secret_key) < 64:
                 raise ValueError("Production secret key must be at least 64 characters")
         
-        return values
+        return self
     
-    @validator("data_directory", "logs_directory", "cache_directory")
+    @field_validator("data_directory", "logs_directory", "cache_directory")
+    @classmethod
     def create_directories(cls, v):
         """Create directories if they don't exist."""
-        Path(v).mkdir(parents=True, exist_ok=True)
+        # Keyed on the absolute path so a later chdir cannot skip a needed mkdir;
+        # abspath only calls getcwd() for relative paths, and ensured ones skip mkdir
+        key = os.path.abspath(v)
+        if key not in _ENSURED_DIRS:
+            Path(v).mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(key)
         return v
+
+
+# Loaded configurations, keyed by source file identity and AGENT_* environment;
+# the oldest entry is dropped once the cache holds _CONFIG_CACHE_SIZE of them
+_CONFIG_CACHE: Dict[tuple, SystemConfig] = {}
+_CONFIG_CACHE_SIZE = 16
+
+# Configuration most recently returned by load_config, read by require_config
+_active_config: Optional[SystemConfig] = None
+
+
+def _config_cache_key(config_path: Optional[Path]) -> tuple:
+    """Build the cache key for a configuration source.
+    
+    The key covers the resolved file path, its modification time and size,
+    plus every ``AGENT_*`` environment variable, so editing the file or the
+    environment yields a fresh configuration. The prefix is matched in any
+    case, as SystemConfig reads the environment case-insensitively.
+    """
+    env_key = tuple(sorted(
+        (key, value) for key, value in os.environ.items()
+        if key.upper().startswith("AGENT_")
+    ))
+    
+    if config_path is None:
+        return (None, env_key)
+    
+    stat = config_path.stat()
+    return (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size, env_key)
+
+
+# Config files at least this large are memory-mapped instead of read through buffers
+_MMAP_MIN_BYTES = 8 * 1024
+
+
+def _parse_config_stream(stream: Any, suffix: str) -> Dict[str, Any]:
+    """Parse configuration data from a binary file object or memory map.
+    
+    Parsers are imported on first use so JSON-only and environment-only
+    deployments never load PyYAML.
+    """
+    if suffix in [".yaml", ".yml"]:
+        import yaml
+        
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load(stream, Loader=loader) or {}
+    
+    if _orjson is not None:
+        return _orjson.loads(stream.read()) or {}
+    
+    import json
+    return json.load(stream) or {}
+
+
+def _read_config_file(config_path: Path) -> Dict[str, Any]:
+    """Parse a YAML or JSON configuration file into a dictionary."""
+    suffix = config_path.suffix.lower()
+    if suffix not in [".yaml", ".yml", ".json"]:
+        raise ValueError(f"Unsupported config file format: {config_path.suffix}")
     
-    class Config:
-        """Pydantic configuration."""
-        env_prefix = "AGENT_"
-        env_nested_delimiter = "__"
-        case_sensitive = False
+    # Small files are cheaper to read directly than to map
+    if config_path.stat().st_size < _MMAP_MIN_BYTES:
+        with open(config_path, "rb") as f:
+            return _parse_config_stream(f, suffix)
+    
+    fd = os.open(config_path, os.O_RDONLY)
+    try:
+        mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        try:
+            return _parse_config_stream(mapped, suffix)
+        finally:
+            mapped.close()
+    finally:
+        os.close(fd)
+
+
+# Default configuration locations, searched in order
+_DEFAULT_CONFIG_DIRS = (".", "config")
+_DEFAULT_CONFIG_NAMES = ("config.yaml", "config.yml", "config.json")
+
+
+def _find_default_config() -> Optional[Path]:
+    """Locate the first default configuration file, if any.
+    
+    Each candidate directory is listed once with ``os.scandir`` instead of
+    issuing a ``stat`` per candidate file name.
+    """
+    for directory in _DEFAULT_CONFIG_DIRS:
+        try:
+            with os.scandir(directory) as entries:
+                found = {
+                    entry.name: entry for entry in entries
+                    if entry.name in _DEFAULT_CONFIG_NAMES
+                }
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        
+        for name in _DEFAULT_CONFIG_NAMES:
+            entry = found.get(name)
+            if entry is not None and entry.is_file():
+                return Path(directory) / name
+    
+    return None
 
 
 def load_config(config_path: Optional[Union[str, Path]] = None) -> SystemConfig:
     """Load configuration from file and environment variables.
     
+    Loaded configurations are cached; repeated calls for an unchanged file and
+    environment return the same instance. Use ``load_config.cache_clear()`` to
+    force a reload. The returned configuration becomes the one checked by
+    ``require_config``.
+    
     Args:
         config_path: Path to configuration file (YAML or JSON)
         
@@ -241,40 +390,21 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> SystemConfig:
         FileNotFoundError: If config file is specified but not found
         ValueError: If configuration is invalid
     """
-    config_data = {}
-    
-    # Load from file if specified
     if config_path:
         config_path = Path(config_path)
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
-        
-        with open(config_path, "r") as f:
-            if config_path.suffix.lower() in [".yaml", ".yml"]:
-                config_data = yaml.safe_load(f) or {}
-            elif config_path.suffix.lower() == ".json":
-                config_data = json.load(f) or {}
-            else:
-                raise ValueError(f"Unsupported config file format: {config_path.suffix}")
-    
-    # Load default configuration paths
-    default_paths = [
-        Path("config.yaml"),
-        Path("config.yml"),
-        Path("config.json"),
-        Path("config") / "config.yaml",
-        Path("config") / "config.yml",
-        Path("config") / "config.json"
-    ]
-    
-    for default_path in default_paths:
-        if not config_path and default_path.exists():
-            with open(default_path, "r") as f:
-                if default_path.suffix.lower() in [".yaml", ".yml"]:
-                    config_data = yaml.safe_load(f) or {}
-                elif default_path.suffix.lower() == ".json":
-                    config_data = json.load(f) or {}
-            break
+    else:
+        config_path = _find_default_config()
+    
+    global _active_config
+    cache_key = _config_cache_key(config_path)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        _active_config = cached
+        return cached
+    
+    config_data = _read_config_file(config_path) if config_path else {}
     
     # Ensure required security configuration
     if "security" not in config_data:
@@ -288,11 +418,27 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> SystemConfig:
         
         config_data["security"] = {"secret_key": secret_key}
     
-    # Create configuration instance (Pydantic will handle env vars)
+    # Create configuration instance (pydantic-settings merges AGENT_* env vars)
     try:
-        return SystemConfig(**config_data)
+        config = SystemConfig(**config_data)
     except Exception as e:
         raise ValueError(f"Invalid configuration: {e}")
+    
+    if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+        del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+    _CONFIG_CACHE[cache_key] = config
+    _active_config = config
+    return config
+
+
+def _clear_config_cache() -> None:
+    """Forget every loaded configuration, including the active one."""
+    global _active_config
+    _CONFIG_CACHE.clear()
+    _active_config = None
+
+
+load_config.cache_clear = _clear_config_cache
 
 
 def validate_config(config: SystemConfig) -> List[str]:
@@ -304,11 +450,11 @@ def validate_config(config: SystemConfig) -> List[str]:
     Returns:
         List of validation warnings
     """
-    warnings = []
+    warnings: List[str] = []
     
-    # Check for missing API keys in production
-    if config.environment == DeploymentEnvironment.PRODUCTION:
-        if not config.openai_api_key and not config.anthropic_api_key:
+    # Production-only checks share a single environment comparison
+    if config.environment is DeploymentEnvironment.PRODUCTION:
+        if not (config.openai_api_key or config.anthropic_api_key):
             warnings.append("No LLM API keys configured for production")
         
         if config.debug:
@@ -331,6 +477,15 @@ def validate_config(config: SystemConfig) -> List[str]:
     return warnings
 
 
+# Fields copied verbatim into the configuration summary
+_SUMMARY_INCLUDE = {
+    "environment": True,
+    "debug": True,
+    "api": {"host", "port", "workers"},
+    "redis": {"host", "port", "ssl"},
+}
+
+
 def get_config_summary(config: SystemConfig) -> Dict[str, Any]:
     """Get a summary of the current configuration.
     
@@ -340,20 +495,9 @@ def get_config_summary(config: SystemConfig) -> Dict[str, Any]:
     Returns:
         Dictionary containing configuration summary
     """
-    return {
-        "environment": config.environment,
-        "debug": config.debug,
-        "api": {
-            "host": config.api.host,
-            "port": config.api.port,
-            "workers": config.api.workers
-        },
+    summary = config.model_dump(include=_SUMMARY_INCLUDE)
+    summary.update({
         "database_configured": config.database is not None,
-        "redis": {
-            "host": config.redis.host,
-            "port": config.redis.port,
-            "ssl": config.redis.ssl
-        },
         "security": {
             "algorithm": config.security.algorithm,
             "cors_enabled": bool(config.security.cors_origins),
@@ -377,20 +521,81 @@ def get_config_summary(config: SystemConfig) -> Dict[str, Any]:
             "anthropic": bool(config.anthropic_api_key),
             "google": bool(config.google_api_key)
         }
-    }
+    })
+    return summary
+
+
+def _current_config() -> SystemConfig:
+    """Return the active configuration, loading the default one on first use."""
+    config = _active_config
+    if config is None:
+        config = load_config()
+    return config
+
+
+def _validate_config_attr(config_attr: str) -> None:
+    """Check that a dotted path names a SystemConfig field or property.
+    
+    Raises:
+        ValueError: If a path segment does not exist
+    """
+    model: Any = SystemConfig
+    for part in config_attr.split("."):
+        if model is None:
+            raise ValueError(f"Unknown configuration attribute '{config_attr}'")
+        field = model.model_fields.get(part)
+        if field is None:
+            if not hasattr(model, part):
+                raise ValueError(f"Unknown configuration attribute '{config_attr}'")
+            model = None
+            continue
+        # Descend into the nested model, unwrapping Optional[...]
+        candidates = (field.annotation, *get_args(field.annotation))
+        model = next(
+            (c for c in candidates if inspect.isclass(c) and issubclass(c, BaseModel)),
+            None
+        )
 
 
 # Configuration validation decorator
 def require_config(config_attr: str):
     """Decorator to ensure configuration attribute is set.
     
+    The attribute path is validated and compiled into an
+    ``operator.attrgetter`` once at decoration time; each call only evaluates
+    the getter against the configuration last returned by ``load_config``.
+    
     Args:
         config_attr: Configuration attribute path (e.g., "database.url")
+        
+    Raises:
+        ValueError: If ``config_attr`` does not name a configuration field
+        RuntimeError: When the decorated function is called and the
+            attribute is None (or lies under a section that is None)
     """
+    _validate_config_attr(config_attr)
+    getter = operator.attrgetter(config_attr)
+    
+    def check() -> None:
+        try:
+            value = getter(_current_config())
+        except AttributeError:
+            # The path is valid, so this is an unset (None) parent section
+            value = None
+        if value is None:
+            raise RuntimeError(f"Configuration '{config_attr}' is not set")
+    
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                check()
+                return await func(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # This would be implemented to check configuration
-            # For now, just pass through
+            check()
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -468,3 +673,46 @@ agents:
 openai_api_key: "${OPENAI_API_KEY}"
 anthropic_api_key: "${ANTHROPIC_API_KEY}"
 """
+
+
+def expand_template(template: str, env: Optional[Mapping[str, str]] = None) -> str:
+    """Substitute ``${VAR}`` placeholders in a configuration template.
+    
+    Unknown placeholders are left in place rather than raising.
+    
+    Args:
+        template: Template text, e.g. PRODUCTION_CONFIG_TEMPLATE
+        env: Variable mapping (defaults to ``os.environ``)
+        
+    Returns:
+        Template text with known placeholders substituted
+    """
+    return string.Template(template).safe_substitute(os.environ if env is None else env)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_template(text: str) -> Dict[str, Any]:
+    """Parse template YAML once per distinct text."""
+    return _parse_config_stream(text, ".yaml")
+
+
+def load_config_template(
+    template: str,
+    env: Optional[Mapping[str, str]] = None,
+    expand: bool = True
+) -> Dict[str, Any]:
+    """Parse a configuration template into a dictionary.
+    
+    Parsed templates are cached by their (expanded) text, so bootstrap
+    scripts and tests reusing the same template skip the YAML parse.
+    
+    Args:
+        template: Template text, e.g. DEVELOPMENT_CONFIG_TEMPLATE
+        env: Variable mapping used for ``${VAR}`` expansion
+        expand: Whether to expand placeholders before parsing
+        
+    Returns:
+        A fresh dictionary that callers may modify
+    """
+    text = expand_template(template, env) if expand else template
+    return copy.deepcopy(_parse_template(text))
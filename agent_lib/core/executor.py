@@ -4,18 +4,108 @@ This module provides robust task execution capabilities with workflow management
 execution context tracking, and comprehensive error handling for production deployments.
 """
 
+import os
+import ast
+import time
+import builtins
+import logging
+import random
 import uuid
 import asyncio
 import inspect
+import functools
+import threading
+import contextvars
+from contextvars import ContextVar
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable, Union, AsyncGenerator
-from datetime import datetime, timezone
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Callable, Union, AsyncGenerator, Tuple, Deque, Set, Container, Iterator
+from datetime import datetime, timezone, timedelta
+from dataclasses import dataclass, field, replace
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from types import CodeType
 
 from pydantic import BaseModel, Field
 
 
+logger = logging.getLogger(__name__)
+
+
+# Random bytes for task IDs, refilled in batches to amortize os.urandom calls
+_UUID_BATCH = 1024
+_uuid_buf = b""
+_uuid_idx = 0
+_uuid_lock = threading.Lock()
+
+
+def _fast_uuid() -> str:
+    """Generate a random (version 4) UUID string from a pre-fetched byte pool."""
+    global _uuid_buf, _uuid_idx
+    with _uuid_lock:
+        if _uuid_idx >= len(_uuid_buf):
+            _uuid_buf = os.urandom(16 * _UUID_BATCH)
+            _uuid_idx = 0
+        raw = _uuid_buf[_uuid_idx:_uuid_idx + 16]
+        _uuid_idx += 16
+    return str(uuid.UUID(bytes=raw, version=4))
+
+
+def _reset_uuid_pool() -> None:
+    """Drop the inherited byte pool so a forked child draws its own IDs."""
+    global _uuid_buf, _uuid_idx, _uuid_lock
+    _uuid_lock = threading.Lock()
+    _uuid_buf = b""
+    _uuid_idx = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
+# State of the workflow step currently executing
+_step_inputs: ContextVar[Dict[str, Any]] = ContextVar("step_inputs")
+_step_results: ContextVar[Dict[str, Any]] = ContextVar("step_results")
+_step_name: ContextVar[str] = ContextVar("step_name")
+
+
+def current_step_context() -> Dict[str, Any]:
+    """Get the context of the workflow step currently executing.
+    
+    Returns:
+        Dictionary with ``inputs``, ``step_results`` and ``step_name``
+        
+    Raises:
+        LookupError: If called outside a workflow step
+    """
+    return {
+        "inputs": _step_inputs.get(),
+        "step_results": _step_results.get(),
+        "step_name": _step_name.get()
+    }
+
+
+def _backoff_delay(
+    retry: int,
+    base: float = 2.0,
+    cap: float = 30.0,
+    jitter: float = 0.1
+) -> float:
+    """Compute the delay before the given retry (1 for the first retry)."""
+    delay = min(cap, base * (2 ** (retry - 1)))
+    return delay * (1 + random.random() * jitter)
+
+
+def _accepts_step_context(func: Callable) -> bool:
+    """Check whether a step function takes the step context as an argument."""
+    try:
+        return bool(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        # Signature unavailable (some builtins); keep the positional contract
+        return True
+
+
 class ExecutionStatus(str, Enum):
     """Task execution status enumeration."""
     
@@ -38,11 +128,11 @@ class TaskPriority(int, Enum):
     CRITICAL = 20
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Context information for task execution."""
     
-    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    task_id: str = field(default_factory=_fast_uuid)
     agent_id: str = ""
     user_id: Optional[str] = None
     session_id: Optional[str] = None
@@ -58,6 +148,12 @@ class ExecutionContext:
     timeout_seconds: int = 300
     retry_attempts: int = 3
     
+    # Retry backoff: base * 2**(retry - 1), capped, plus up to `jitter` fraction
+    backoff_base: float = 2.0
+    backoff_cap: float = 30.0
+    backoff_jitter: float = 0.1
+    retry_on_timeout: bool = True
+    
     # Context data
     context_data: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -72,9 +168,20 @@ class ExecutionContext:
     error_details: Optional[Dict[str, Any]] = None
     retry_count: int = 0
     
+    # Monotonic clock readings backing execution_time
+    _started_monotonic: Optional[float] = field(default=None, repr=False, compare=False)
+    _completed_monotonic: Optional[float] = field(default=None, repr=False, compare=False)
+    
     @property
     def execution_time(self) -> Optional[float]:
         """Calculate execution time in seconds."""
+        if self._started_monotonic is not None:
+            end = self._completed_monotonic
+            if end is None:
+                end = time.monotonic()
+            return end - self._started_monotonic
+        
+        # Timestamps set directly rather than via mark_started/mark_completed
         if self.started_at and self.completed_at:
             return (self.completed_at - self.started_at).total_seconds()
         elif self.started_at:
@@ -96,10 +203,83 @@ class ExecutionContext:
             ExecutionStatus.TIMEOUT
         ]
     
+    def mark_started(self) -> None:
+        """Record the start of execution."""
+        self._started_monotonic = time.monotonic()
+        self.started_at = datetime.now(timezone.utc)
+    
+    def mark_completed(self) -> None:
+        """Record the end of execution.
+        
+        The wall-clock completion time is derived from the monotonic duration
+        instead of reading the system clock again.
+        """
+        self._completed_monotonic = time.monotonic()
+        if self.started_at is not None and self._started_monotonic is not None:
+            self.completed_at = self.started_at + timedelta(
+                seconds=self._completed_monotonic - self._started_monotonic
+            )
+        else:
+            self.completed_at = datetime.now(timezone.utc)
+    
     def update_progress(self, step: str, percentage: float) -> None:
         """Update execution progress."""
         self.current_step = step
         self.progress_percentage = max(0.0, min(100.0, percentage))
+    
+    def reset(self) -> None:
+        """Return the context to its freshly-constructed state.
+        
+        A new task ID and timestamps are generated; the existing dicts are
+        cleared and reused rather than reallocated.
+        """
+        context_data, metadata = self.context_data, self.metadata
+        context_data.clear()
+        metadata.clear()
+        
+        self.__init__(context_data=context_data, metadata=metadata)
+    
+    def snapshot(self) -> "ExecutionContext":
+        """Return a copy whose dicts are independent of this context."""
+        return replace(
+            self,
+            context_data=dict(self.context_data),
+            metadata=dict(self.metadata),
+            error_details=dict(self.error_details) if self.error_details else self.error_details
+        )
+
+
+class _ContextPool:
+    """Free-list of executor-owned ExecutionContext objects.
+    
+    Contexts passed in by callers are never pooled; only those the executor
+    creates itself are recycled once their result has been materialized.
+    """
+    
+    def __init__(self, max_size: int = 256) -> None:
+        self._free: deque = deque(maxlen=max_size)
+    
+    def acquire(self, **fields: Any) -> ExecutionContext:
+        """Get a clean context, optionally overriding some fields."""
+        if self._free:
+            context = self._free.pop()
+            # Identity and creation time belong to the task acquiring the
+            # context, not to the moment it was returned to the pool
+            context.task_id = _fast_uuid()
+            context.created_at = datetime.now(timezone.utc)
+        else:
+            context = ExecutionContext()
+        for name, value in fields.items():
+            setattr(context, name, value)
+        return context
+    
+    def release(self, context: ExecutionContext) -> None:
+        """Reset a context and return it to the pool."""
+        context.reset()
+        self._free.append(context)
+
+
+_context_pool = _ContextPool()
 
 
 class ExecutionResult(BaseModel):
@@ -127,9 +307,29 @@ class ExecutionResult(BaseModel):
     # Metadata
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
+    @classmethod
+    def from_context(cls, context: ExecutionContext, result: Any) -> "ExecutionResult":
+        """Build a result from an execution context without re-validation.
+        
+        Every field comes from an executor-maintained context, so the model is
+        created with ``model_construct``. Dicts are copied because executor-owned
+        contexts are recycled after the result is built.
+        """
+        return cls.model_construct(
+            task_id=context.task_id,
+            status=context.status,
+            success=context.status == ExecutionStatus.COMPLETED,
+            result=result,
+            error=context.error_message,
+            error_details=dict(context.error_details) if context.error_details else context.error_details,
+            execution_time=context.execution_time,
+            created_at=context.created_at,
+            started_at=context.started_at,
+            completed_at=context.completed_at,
+            progress_percentage=context.progress_percentage,
+            current_step=context.current_step,
+            metadata=dict(context.metadata)
+        )
 
 
 class WorkflowStep(BaseModel):
@@ -154,113 +354,190 @@ class Workflow(BaseModel):
     steps: List[WorkflowStep] = Field(..., description="Workflow steps")
     parallel_execution: bool = Field(default=False, description="Enable parallel step execution")
     
-    def get_executable_steps(self, completed_steps: List[str]) -> List[WorkflowStep]:
-        """Get steps that can be executed given completed steps."""
-        executable = []
+    def get_executable_steps(self, completed_steps: Container[str]) -> Iterator[WorkflowStep]:
+        """Yield steps that can be executed given completed steps."""
         for step in self.steps:
             if step.name not in completed_steps:
                 # Check if all dependencies are satisfied
                 if all(dep in completed_steps for dep in step.depends_on):
-                    executable.append(step)
-        return executable
+                    yield step
     
     def validate_dependencies(self) -> bool:
         """Validate workflow step dependencies for cycles."""
-        # Simple cycle detection using DFS
+        # Iterative DFS so long dependency chains cannot hit the recursion limit
+        by_name = {s.name: s for s in self.steps}
         visited = set()
         rec_stack = set()
         
-        def has_cycle(step_name: str) -> bool:
-            visited.add(step_name)
-            rec_stack.add(step_name)
+        for root in by_name:
+            if root in visited:
+                continue
             
-            step = next((s for s in self.steps if s.name == step_name), None)
-            if step:
-                for dep in step.depends_on:
-                    if dep not in visited:
-                        if has_cycle(dep):
-                            return True
-                    elif dep in rec_stack:
-                        return True
+            visited.add(root)
+            rec_stack.add(root)
+            stack = [(root, iter(by_name[root].depends_on))]
             
-            rec_stack.remove(step_name)
-            return False
-        
-        for step in self.steps:
-            if step.name not in visited:
-                if has_cycle(step.name):
-                    return False
+            while stack:
+                node, deps = stack[-1]
+                for dep in deps:
+                    if dep in rec_stack:
+                        return False
+                    if dep not in visited:
+                        visited.add(dep)
+                        if dep in by_name:
+                            rec_stack.add(dep)
+                            stack.append((dep, iter(by_name[dep].depends_on)))
+                            break
+                else:
+                    # All dependencies of node explored
+                    stack.pop()
+                    rec_stack.discard(node)
         
         return True
 
 
+@dataclass
+class WorkflowPlan:
+    """Dependency graph of a workflow, precomputed at registration time.
+    
+    Execution follows Kahn's algorithm: a step becomes ready once every step
+    it depends on has completed, so scheduling never rescans the step list.
+    """
+    
+    steps: Dict[str, WorkflowStep]
+    successors: Dict[str, List[str]]
+    in_degree: Dict[str, int]
+    conditions: Dict[str, CodeType] = field(default_factory=dict)
+    
+    @classmethod
+    def from_workflow(cls, workflow: Workflow) -> "WorkflowPlan":
+        """Build the plan for a workflow.
+        
+        Dependencies on unknown steps still count towards a step's in-degree,
+        so such steps never become ready.
+        """
+        steps = {step.name: step for step in workflow.steps}
+        successors: Dict[str, List[str]] = {name: [] for name in steps}
+        in_degree: Dict[str, int] = {}
+        conditions: Dict[str, CodeType] = {}
+        
+        for step in workflow.steps:
+            in_degree[step.name] = len(step.depends_on)
+            for dep in step.depends_on:
+                if dep in successors:
+                    successors[dep].append(step.name)
+            if step.condition:
+                conditions[step.name] = _compile_condition(step)
+        
+        return cls(
+            steps=steps, successors=successors, in_degree=in_degree, conditions=conditions
+        )
+
+
+# Names a condition expression may read without binding them itself; builtin
+# names count too, so a call such as len(...) fails loudly instead of being
+# taken for free-form text (conditions are evaluated without builtins)
+_CONDITION_NAMES = frozenset({"inputs", "step_results", *dir(builtins)})
+
+
+def _is_condition_expression(tree: ast.Expression) -> bool:
+    """Check that an expression only reads known names or names it binds."""
+    loaded = set()
+    bound = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            (loaded if isinstance(node.ctx, ast.Load) else bound).add(node.id)
+    return loaded - bound <= _CONDITION_NAMES
+
+
+def _compile_condition(step: WorkflowStep) -> CodeType:
+    """Compile a step condition once so each evaluation only runs bytecode.
+    
+    Conditions that are not expressions over ``inputs`` and ``step_results``
+    (free-form text such as "yes") keep the original rule: anything but
+    "false" counts as true. They compile to a constant.
+    """
+    source = step.condition.strip()
+    filename = f"<cond:{step.name}>"
+    # Plain "true"/"false" in any case keep their original meaning
+    if source.lower() in ("true", "false"):
+        source = source.capitalize()
+    try:
+        tree = ast.parse(source, filename, "eval")
+    except SyntaxError:
+        tree = None
+    if tree is None or not _is_condition_expression(tree):
+        source = repr(step.condition.lower() != "false")
+        return compile(source, filename, "eval")
+    return compile(tree, filename, "eval")
+
+
 class TaskExecutor:
     """Production-ready task executor with workflow management."""
     
-    def __init__(self, max_concurrent_tasks: int = 10) -> None:
+    def __init__(self, max_concurrent_tasks: int = 10, history_cap: int = 10_000) -> None:
         """Initialize task executor.
         
         Args:
             max_concurrent_tasks: Maximum number of concurrent tasks
+            history_cap: Maximum number of execution results kept in history
         """
         self.max_concurrent_tasks = max_concurrent_tasks
         self._active_tasks: Dict[str, ExecutionContext] = {}
         self._task_futures: Dict[str, asyncio.Task] = {}
         self._workflow_registry: Dict[str, Workflow] = {}
+        self._workflow_plans: Dict[str, WorkflowPlan] = {}
         self._function_registry: Dict[str, Callable] = {}
-        self._execution_history: List[ExecutionResult] = []
+        # Registered function name -> (function, is coroutine, takes step context)
+        self._resolved_functions: Dict[str, Tuple[Callable, bool, bool]] = {}
+        self._execution_history: Deque[ExecutionResult] = deque(maxlen=history_cap)
         
-        # Task queue for managing capacity
-        self._task_queue: asyncio.Queue = asyncio.Queue()
-        self._worker_tasks: List[asyncio.Task] = []
+        # Bounds the number of tasks executing at once
+        self._semaphore = asyncio.Semaphore(max_concurrent_tasks)
+        # Set by shutdown; calls that get a slot afterwards are turned away
+        self._closed = False
+        # Calls queued for a slot; shutdown waits until they have been turned away
+        self._slot_waiters = 0
+        self._no_slot_waiters = asyncio.Event()
+        self._no_slot_waiters.set()
         
-        # Start worker tasks
-        self._start_workers()
-    
-    def _start_workers(self) -> None:
-        """Start worker tasks for processing the task queue."""
-        for i in range(self.max_concurrent_tasks):
-            worker = asyncio.create_task(self._worker())
-            self._worker_tasks.append(worker)
-    
-    async def _worker(self) -> None:
-        """Worker coroutine for processing tasks from the queue."""
-        while True:
-            try:
-                # Get task from queue
-                context, func, args, kwargs = await self._task_queue.get()
-                
-                # Execute task
-                await self._execute_task_internal(context, func, args, kwargs)
-                
-                # Mark task as done
-                self._task_queue.task_done()
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                # Log error but continue processing
-                print(f"Worker error: {e}")
+        # Sync callables get their own pool under the same bound, instead of
+        # sharing the loop's default executor with the rest of the application
+        self._sync_executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_tasks, thread_name_prefix="agent-sync"
+        )
     
     def register_function(self, name: str, func: Callable) -> None:
         """Register a function for workflow execution.
         
+        Functions that accept an argument are called with the step context
+        dict; zero-argument functions can read it via ``current_step_context()``.
+        
         Args:
             name: Function name
             func: Function to register
         """
         self._function_registry[name] = func
+        self._resolved_functions[name] = (
+            func,
+            asyncio.iscoroutinefunction(func),
+            _accepts_step_context(func),
+        )
     
     def register_workflow(self, workflow: Workflow) -> None:
         """Register a workflow definition.
         
         Args:
             workflow: Workflow to register
+            
+        Raises:
+            ValueError: If the workflow has circular dependencies
         """
         if not workflow.validate_dependencies():
             raise ValueError(f"Workflow {workflow.name} has circular dependencies")
         
         self._workflow_registry[workflow.name] = workflow
+        self._workflow_plans[workflow.name] = WorkflowPlan.from_workflow(workflow)
     
     async def execute_task(
         self,
@@ -278,39 +555,36 @@ class TaskExecutor:
             **kwargs: Function keyword arguments
             
         Returns:
-            ExecutionResult containing outcome
+            ExecutionResult containing outcome; tasks stopped by ``cancel_task``,
+            calls made after ``shutdown`` and calls still waiting for a slot
+            when it runs come back CANCELLED
         """
-        if context is None:
-            context = ExecutionContext()
+        owns_context = context is None
+        if owns_context:
+            context = _context_pool.acquire()
         
         # Set initial status
         context.status = ExecutionStatus.PENDING
         self._active_tasks[context.task_id] = context
         
         try:
-            # Add task to queue
-            await self._task_queue.put((context, func, args, kwargs))
-            
-            # Wait for completion
-            while not context.is_complete:
-                await asyncio.sleep(0.1)
+            # Wait for capacity, then run in a child task
+            if self._semaphore.locked():
+                await self._wait_for_slot()
+            else:
+                await self._semaphore.acquire()
+            try:
+                # shutdown() may have run while this call waited for a slot
+                if self._closed:
+                    context.status = ExecutionStatus.CANCELLED
+                    context.error_message = "Task executor has been shut down"
+                else:
+                    await self._run_tracked(context, func, args, kwargs)
+            finally:
+                self._semaphore.release()
             
             # Create result
-            result = ExecutionResult(
-                task_id=context.task_id,
-                status=context.status,
-                success=context.status == ExecutionStatus.COMPLETED,
-                result=context.context_data.get("result"),
-                error=context.error_message,
-                error_details=context.error_details,
-                execution_time=context.execution_time,
-                created_at=context.created_at,
-                started_at=context.started_at,
-                completed_at=context.completed_at,
-                progress_percentage=context.progress_percentage,
-                current_step=context.current_step,
-                metadata=context.metadata
-            )
+            result = ExecutionResult.from_context(context, context.context_data.get("result"))
             
             # Store in history
             self._execution_history.append(result)
@@ -321,6 +595,51 @@ class TaskExecutor:
             # Cleanup
             if context.task_id in self._active_tasks:
                 del self._active_tasks[context.task_id]
+            if owns_context:
+                _context_pool.release(context)
+    
+    async def _run_tracked(
+        self,
+        context: ExecutionContext,
+        func: Callable,
+        args: tuple,
+        kwargs: dict
+    ) -> None:
+        """Run a task in its own child task, which cancel_task can reach.
+        
+        Cancelling the child only ends this task, which is then reported as
+        CANCELLED; cancelling the caller cancels the child too and propagates.
+        """
+        work = asyncio.create_task(self._execute_task_internal(context, func, args, kwargs))
+        self._task_futures[context.task_id] = work
+        try:
+            await asyncio.wait((work,))
+        except asyncio.CancelledError:
+            # The caller was cancelled; wait for the child to stop using the context
+            work.cancel()
+            await asyncio.wait((work,))
+            raise
+        finally:
+            self._task_futures.pop(context.task_id, None)
+        
+        if work.cancelled():
+            # Cancelled before its first step, so it never marked itself
+            if context.status is not ExecutionStatus.CANCELLED:
+                context.status = ExecutionStatus.CANCELLED
+                context.error_message = "Task was cancelled"
+            return
+        work.result()
+    
+    async def _wait_for_slot(self) -> None:
+        """Acquire a task slot, counted as a waiter until it is granted."""
+        self._slot_waiters += 1
+        self._no_slot_waiters.clear()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._slot_waiters -= 1
+            if not self._slot_waiters:
+                self._no_slot_waiters.set()
     
     async def _execute_task_internal(
         self,
@@ -330,53 +649,69 @@ class TaskExecutor:
         kwargs: dict
     ) -> None:
         """Internal task execution with retry logic."""
-        context.started_at = datetime.now(timezone.utc)
+        context.mark_started()
         context.status = ExecutionStatus.RUNNING
+        is_coroutine = asyncio.iscoroutinefunction(func)
         
-        for attempt in range(context.retry_attempts + 1):
-            try:
-                context.retry_count = attempt
-                
-                if attempt > 0:
-                    context.status = ExecutionStatus.RETRYING
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                
-                # Execute with timeout
-                if asyncio.iscoroutinefunction(func):
-                    result = await asyncio.wait_for(
-                        func(*args, **kwargs),
-                        timeout=context.timeout_seconds
-                    )
-                else:
-                    # Run synchronous function in thread pool
-                    loop = asyncio.get_event_loop()
-                    result = await asyncio.wait_for(
-                        loop.run_in_executor(None, lambda: func(*args, **kwargs)),
-                        timeout=context.timeout_seconds
-                    )
-                
-                # Success
-                context.context_data["result"] = result
-                context.status = ExecutionStatus.COMPLETED
-                context.completed_at = datetime.now(timezone.utc)
-                context.progress_percentage = 100.0
-                return
-                
-            except asyncio.TimeoutError:
-                context.error_message = f"Task timed out after {context.timeout_seconds} seconds"
-                context.status = ExecutionStatus.TIMEOUT
-            except Exception as e:
-                context.error_message = str(e)
-                context.error_details = {
-                    "exception_type": type(e).__name__,
-                    "attempt": attempt + 1,
-                    "max_attempts": context.retry_attempts + 1
-                }
-                
-                if attempt == context.retry_attempts:
-                    context.status = ExecutionStatus.FAILED
+        try:
+            for attempt in range(context.retry_attempts + 1):
+                try:
+                    context.retry_count = attempt
+                    
+                    if attempt > 0:
+                        context.status = ExecutionStatus.RETRYING
+                        await asyncio.sleep(_backoff_delay(
+                            attempt, context.backoff_base, context.backoff_cap, context.backoff_jitter
+                        ))
+                    
+                    # Execute with timeout
+                    async with asyncio.timeout(context.timeout_seconds):
+                        if is_coroutine:
+                            result = await func(*args, **kwargs)
+                        else:
+                            # Run synchronous function in thread pool
+                            loop = asyncio.get_running_loop()
+                            if kwargs:
+                                result = await loop.run_in_executor(
+                                    self._sync_executor, functools.partial(func, *args, **kwargs)
+                                )
+                            else:
+                                result = await loop.run_in_executor(self._sync_executor, func, *args)
+                    
+                    # Success
+                    context.context_data["result"] = result
+                    context.status = ExecutionStatus.COMPLETED
+                    context.progress_percentage = 100.0
+                    return
+                    
+                except asyncio.TimeoutError:
+                    context.error_message = f"Task timed out after {context.timeout_seconds} seconds"
+                    context.status = ExecutionStatus.TIMEOUT
+                    if not context.retry_on_timeout:
+                        break
+                except Exception as e:
+                    context.error_message = str(e)
+                    context.error_details = {
+                        "exception_type": type(e).__name__,
+                        "attempt": attempt + 1,
+                        "max_attempts": context.retry_attempts + 1
+                    }
+                    
+                    if attempt == context.retry_attempts:
+                        context.status = ExecutionStatus.FAILED
         
-        context.completed_at = datetime.now(timezone.utc)
+        except asyncio.CancelledError:
+            context.status = ExecutionStatus.CANCELLED
+            context.error_message = "Task was cancelled"
+            raise
+        except Exception as e:
+            # Never leave the context looking like it is still running
+            logger.exception("Task %s failed outside the retry loop", context.task_id)
+            context.status = ExecutionStatus.FAILED
+            context.error_message = str(e)
+            raise
+        finally:
+            context.mark_completed()
     
     async def execute_workflow(
         self,
@@ -394,77 +729,100 @@ class TaskExecutor:
         Returns:
             ExecutionResult containing workflow outcome
         """
-        if context is None:
-            context = ExecutionContext(task_type="workflow")
-        
         workflow = self._workflow_registry.get(workflow_name)
         if not workflow:
             raise ValueError(f"Workflow {workflow_name} not found")
         
+        owns_context = context is None
+        if owns_context:
+            context = _context_pool.acquire(task_type="workflow")
+        
         context.status = ExecutionStatus.RUNNING
-        context.started_at = datetime.now(timezone.utc)
+        context.mark_started()
         context.context_data["workflow_inputs"] = inputs
         context.context_data["workflow_results"] = {}
         
-        completed_steps = []
+        plan = self._workflow_plans[workflow_name]
+        in_degree = dict(plan.in_degree)
+        ready = deque(name for name in plan.steps if in_degree[name] == 0)
+        
+        completed_steps: Set[str] = set()
         step_results = {}
         
+        def complete_step(step_name: str) -> None:
+            """Mark a step done and release successors whose dependencies are met."""
+            completed_steps.add(step_name)
+            for successor in plan.successors[step_name]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    ready.append(successor)
+        
+        # In-flight parallel steps
+        running: Dict[asyncio.Task, WorkflowStep] = {}
+        
         try:
-            while len(completed_steps) < len(workflow.steps):
-                executable_steps = workflow.get_executable_steps(completed_steps)
-                
-                if not executable_steps:
-                    # Check for required steps that can't be executed
-                    remaining_steps = [s for s in workflow.steps if s.name not in completed_steps]
-                    required_remaining = [s for s in remaining_steps if s.required]
-                    
-                    if required_remaining:
-                        raise RuntimeError(
-                            f"Required steps cannot be executed: {[s.name for s in required_remaining]}"
-                        )
-                    break
-                
+            while ready or running:
                 # Execute steps
                 if workflow.parallel_execution:
-                    # Parallel execution
-                    step_tasks = []
-                    for step in executable_steps:
-                        if self._should_execute_step(step, step_results):
+                    # Start every ready step
+                    while ready:
+                        step = plan.steps[ready.popleft()]
+                        if self._should_execute_step(plan, step, inputs, step_results):
                             task = asyncio.create_task(
                                 self._execute_workflow_step(step, inputs, step_results)
                             )
-                            step_tasks.append((step, task))
+                            running[task] = step
+                        else:
+                            complete_step(step.name)
+                    
+                    if not running:
+                        continue
                     
-                    # Wait for all steps to complete
-                    for step, task in step_tasks:
+                    # Any finished step immediately unlocks its successors
+                    done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    failure: Optional[Exception] = None
+                    for task in done:
+                        step = running.pop(task)
                         try:
-                            result = await task
-                            step_results[step.name] = result
-                            completed_steps.append(step.name)
+                            step_results[step.name] = task.result()
                         except Exception as e:
                             if step.required:
-                                raise
+                                # Keep draining so every finished task's outcome is retrieved
+                                if failure is None:
+                                    failure = e
+                                continue
                             step_results[step.name] = {"error": str(e)}
-                            completed_steps.append(step.name)
+                        complete_step(step.name)
+                    if failure is not None:
+                        raise failure
                 
                 else:
                     # Sequential execution
-                    for step in executable_steps:
-                        if self._should_execute_step(step, step_results):
-                            try:
-                                result = await self._execute_workflow_step(step, inputs, step_results)
-                                step_results[step.name] = result
-                                completed_steps.append(step.name)
-                                
-                                # Update progress
-                                progress = len(completed_steps) / len(workflow.steps) * 100
-                                context.update_progress(step.name, progress)
-                                
-                            except Exception as e:
-                                if step.required:
-                                    raise
-                                step_results[step.name] = {"error": str(e)}
-                                completed_steps.append(step.name)
+                    step = plan.steps[ready.popleft()]
+                    if self._should_execute_step(plan, step, inputs, step_results):
+                        try:
+                            step_results[step.name] = await self._execute_workflow_step(
+                                step, inputs, step_results
+                            )
+                        except Exception as e:
+                            if step.required:
+                                raise
+                            step_results[step.name] = {"error": str(e)}
+                    complete_step(step.name)
+                    
+                    # Update progress
+                    progress = len(completed_steps) / len(workflow.steps) * 100
+                    context.update_progress(step.name, progress)
+            
+            # Steps still pending depend on something that never completed
+            required_remaining = [
+                s.name for s in workflow.steps
+                if s.name not in completed_steps and s.required
+            ]
+            if required_remaining:
+                raise RuntimeError(
+                    f"Required steps cannot be executed: {required_remaining}"
+                )
             
             # Workflow completed successfully
             context.status = ExecutionStatus.COMPLETED
@@ -476,41 +834,49 @@ class TaskExecutor:
             context.error_message = str(e)
             context.error_details = {
                 "workflow_name": workflow_name,
-                "completed_steps": completed_steps,
+                "completed_steps": [s.name for s in workflow.steps if s.name in completed_steps],
                 "step_results": step_results
             }
         
         finally:
-            context.completed_at = datetime.now(timezone.utc)
+            # Abandon parallel steps still running after a failure, and wait for
+            # them to unwind so none is left pending or unretrieved
+            if running:
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+            context.mark_completed()
         
-        return ExecutionResult(
-            task_id=context.task_id,
-            status=context.status,
-            success=context.status == ExecutionStatus.COMPLETED,
-            result=context.context_data.get("workflow_results"),
-            error=context.error_message,
-            error_details=context.error_details,
-            execution_time=context.execution_time,
-            created_at=context.created_at,
-            started_at=context.started_at,
-            completed_at=context.completed_at,
-            progress_percentage=context.progress_percentage,
-            current_step=context.current_step,
-            metadata=context.metadata
-        )
+        result = ExecutionResult.from_context(context, context.context_data.get("workflow_results"))
+        
+        if owns_context:
+            _context_pool.release(context)
+        
+        return result
     
-    def _should_execute_step(self, step: WorkflowStep, step_results: Dict[str, Any]) -> bool:
-        """Check if a workflow step should be executed based on conditions."""
-        if step.condition:
-            # Simple condition evaluation (can be extended)
-            # For now, just check if condition is "true" or "false"
-            if step.condition.lower() == "false":
-                return False
-            
-            # Could implement more complex condition evaluation here
-            # using step_results and other context
+    def _should_execute_step(
+        self,
+        plan: WorkflowPlan,
+        step: WorkflowStep,
+        inputs: Dict[str, Any],
+        step_results: Dict[str, Any]
+    ) -> bool:
+        """Check if a workflow step should be executed based on conditions.
         
-        return True
+        Conditions are Python expressions over ``inputs`` and ``step_results``,
+        compiled at registration and evaluated without builtins; other text
+        counts as true unless it is "false".
+        """
+        code = plan.conditions.get(step.name)
+        if code is None:
+            return True
+        
+        # A single namespace, so comprehensions in conditions can see the names
+        return bool(eval(code, {
+            "__builtins__": {},
+            "inputs": inputs,
+            "step_results": step_results
+        }))
     
     async def _execute_workflow_step(
         self,
@@ -519,38 +885,44 @@ class TaskExecutor:
         step_results: Dict[str, Any]
     ) -> Any:
         """Execute a single workflow step."""
-        func = self._function_registry.get(step.function)
-        if not func:
+        resolved = self._resolved_functions.get(step.function)
+        if resolved is None:
             raise ValueError(f"Function {step.function} not found in registry")
+        func, is_coroutine, takes_context = resolved
         
-        # Prepare step context
-        step_context = {
-            "inputs": inputs,
-            "step_results": step_results,
-            "step_name": step.name
-        }
+        # Expose step state through context variables; the dict form is only
+        # built for functions that take it as an argument
+        tokens = (
+            _step_inputs.set(inputs),
+            _step_results.set(step_results),
+            _step_name.set(step.name),
+        )
+        call_args = (current_step_context(),) if takes_context else ()
         
-        # Execute with step-specific timeout and retry
-        for attempt in range(step.retry_attempts + 1):
-            try:
-                if asyncio.iscoroutinefunction(func):
-                    result = await asyncio.wait_for(
-                        func(step_context),
-                        timeout=step.timeout_seconds
-                    )
-                else:
-                    loop = asyncio.get_event_loop()
-                    result = await asyncio.wait_for(
-                        loop.run_in_executor(None, lambda: func(step_context)),
-                        timeout=step.timeout_seconds
-                    )
-                
-                return result
-                
-            except Exception as e:
-                if attempt == step.retry_attempts:
-                    raise
-                await asyncio.sleep(2 ** attempt)
+        try:
+            # Execute with step-specific timeout and retry
+            for attempt in range(step.retry_attempts + 1):
+                try:
+                    async with asyncio.timeout(step.timeout_seconds):
+                        if is_coroutine:
+                            result = await func(*call_args)
+                        else:
+                            # Executor threads do not inherit context variables
+                            loop = asyncio.get_running_loop()
+                            result = await loop.run_in_executor(
+                                self._sync_executor, contextvars.copy_context().run, func, *call_args
+                            )
+                    
+                    return result
+                    
+                except Exception as e:
+                    if attempt == step.retry_attempts:
+                        raise
+                    await asyncio.sleep(_backoff_delay(attempt + 1, base=1.0))
+        finally:
+            _step_name.reset(tokens[2])
+            _step_results.reset(tokens[1])
+            _step_inputs.reset(tokens[0])
     
     def get_task_status(self, task_id: str) -> Optional[ExecutionContext]:
         """Get status of an active task.
@@ -559,13 +931,15 @@ class TaskExecutor:
             task_id: Task identifier
             
         Returns:
-            ExecutionContext if task is active, None otherwise
+            Snapshot of the task's ExecutionContext if task is active, None otherwise
         """
-        return self._active_tasks.get(task_id)
+        # Snapshots, since executor-owned contexts are recycled for later tasks
+        context = self._active_tasks.get(task_id)
+        return context.snapshot() if context is not None else None
     
     def list_active_tasks(self) -> List[ExecutionContext]:
-        """List all active tasks."""
-        return list(self._active_tasks.values())
+        """List snapshots of all active tasks."""
+        return [context.snapshot() for context in self._active_tasks.values()]
     
     def get_execution_history(self, limit: int = 100) -> List[ExecutionResult]:
         """Get execution history.
@@ -574,40 +948,44 @@ class TaskExecutor:
             limit: Maximum number of results to return
             
         Returns:
-            List of execution results
+            List of execution results, oldest first
         """
-        return self._execution_history[-limit:]
+        start = max(0, len(self._execution_history) - limit)
+        return list(islice(self._execution_history, start, None))
     
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel an active task.
         
+        Only the task's own child task is cancelled; the caller awaiting
+        ``execute_task`` receives a CANCELLED ``ExecutionResult``.
+        
         Args:
             task_id: Task identifier
             
         Returns:
             True if task was cancelled, False if not found
         """
-        if task_id in self._task_futures:
-            self._task_futures[task_id].cancel()
-            
-            if task_id in self._active_tasks:
-                context = self._active_tasks[task_id]
-                context.status = ExecutionStatus.CANCELLED
-                context.completed_at = datetime.now(timezone.utc)
-            
-            return True
+        task = self._task_futures.get(task_id)
+        if task is None or task.done():
+            return False
         
-        return False
+        # The task marks its own context cancelled as the CancelledError unwinds
+        return task.cancel()
     
     async def shutdown(self) -> None:
-        """Shutdown the task executor gracefully."""
-        # Cancel all worker tasks
-        for worker in self._worker_tasks:
-            worker.cancel()
+        """Shutdown the task executor gracefully.
         
-        # Wait for workers to finish
-        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        Running tasks are cancelled, and calls still waiting for a slot are
+        returned CANCELLED without running before this method returns.
+        """
+        self._closed = True
         
         # Cancel any remaining active tasks
         for task_id in list(self._active_tasks.keys()):
             await self.cancel_task(task_id)
+        
+        # Cancelled tasks free their slots, letting queued calls see the flag
+        await self._no_slot_waiters.wait()
+        
+        # Stop the sync worker threads; queued calls are dropped
+        self._sync_executor.shutdown(wait=False, cancel_futures=True)
@@ -5,16 +5,50 @@ with external services, APIs, and functions in a secure and observable manner.
 """
 
 import asyncio
+import time
 import inspect
 import json
+import functools
+import types
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Callable, Union, Type
+from typing import Dict, List, Optional, Any, Callable, Union, Type, FrozenSet, Container, Tuple, Iterable, Awaitable
+from typing import get_args, get_origin
 from enum import Enum
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 import httpx
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+
+
+# orjson is an optional, faster drop-in for schema encoding and response parsing
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+
+# numba is optional and only needed for JIT-compiled numeric tools
+try:
+    import numba as _numba
+except ImportError:  # pragma: no cover - optional dependency
+    _numba = None
+
+
+# Connection pool bounds for API tool clients
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30
+)
+
 
 class ToolType(str, Enum):
     """Tool type enumeration."""
@@ -50,6 +84,7 @@ class ToolConfig(BaseModel):
     # Execution settings
     timeout_seconds: int = Field(default=30, gt=0, description="Tool execution timeout")
     retry_attempts: int = Field(default=2, ge=0, description="Number of retry attempts")
+    max_workers: int = Field(default=8, gt=0, description="Worker threads for synchronous function tools")
     
     # Security settings
     requires_auth: bool = Field(default=False, description="Whether tool requires authentication")
@@ -60,15 +95,18 @@ class ToolConfig(BaseModel):
     base_url: Optional[str] = Field(default=None, description="Base URL for API tools")
     api_key: Optional[str] = Field(default=None, description="API key for authentication")
     headers: Dict[str, str] = Field(default_factory=dict, description="Default headers")
+    stream_threshold_bytes: int = Field(
+        default=1_048_576, gt=0, description="Response size above which API bodies are streamed"
+    )
     
     # Validation settings
     validate_inputs: bool = Field(default=True, description="Enable input validation")
     validate_outputs: bool = Field(default=True, description="Enable output validation")
     
-    class Config:
-        """Pydantic configuration."""
-        frozen = True
-        extra = "forbid"
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+_VALID_PARAM_TYPES = frozenset({"str", "int", "float", "bool", "list", "dict", "any"})
 
 
 class ToolParameter(BaseModel):
@@ -81,12 +119,12 @@ class ToolParameter(BaseModel):
     default: Optional[Any] = Field(default=None, description="Default value")
     enum_values: Optional[List[Any]] = Field(default=None, description="Allowed enum values")
     
-    @validator("type")
+    @field_validator("type")
+    @classmethod
     def validate_type(cls, v):
         """Validate parameter type."""
-        valid_types = ["str", "int", "float", "bool", "list", "dict", "any"]
-        if v not in valid_types:
-            raise ValueError(f"Invalid type: {v}. Valid types: {valid_types}")
+        if v not in _VALID_PARAM_TYPES:
+            raise ValueError(f"Invalid type: {v}. Valid types: {sorted(_VALID_PARAM_TYPES)}")
         return v
 
 
@@ -97,6 +135,60 @@ class ToolSchema(BaseModel):
     description: str = Field(..., description="Tool description")
     parameters: List[ToolParameter] = Field(..., description="Tool parameters")
     
+    model_config = ConfigDict(frozen=True)
+    
+    @functools.cached_property
+    def openai_schema(self) -> Dict[str, Any]:
+        """OpenAI function calling schema, built once per schema instance.
+        
+        The same dict is returned on every access and must not be mutated;
+        use ``to_openai_schema`` for a private copy.
+        """
+        return self.to_openai_schema()
+    
+    @functools.cached_property
+    def openai_schema_compact(self) -> bytes:
+        """Minified function schema, encoded once per schema instance."""
+        properties = {}
+        required = []
+        
+        for param in self.parameters:
+            prop: Dict[str, Any] = {"type": param.type}
+            if param.description:
+                prop["description"] = param.description
+            if param.enum_values:
+                prop["enum"] = param.enum_values
+            properties[param.name] = prop
+            
+            if param.required:
+                required.append(param.name)
+        
+        schema = {
+            "name": self.name,
+            "description": self.description,
+            "parameters": {
+                "type": "object",
+                "properties": properties,
+                "required": required
+            }
+        }
+        
+        if _orjson is not None:
+            return _orjson.dumps(schema)
+        return json.dumps(schema, separators=(",", ":")).encode()
+    
+    def to_openai_schema_compact(self) -> bytes:
+        """Convert to a minified JSON function schema.
+        
+        Only the function object is emitted, without the outer
+        ``{"type": "function"}`` wrapper, and empty parameter descriptions
+        are dropped.
+        
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return self.openai_schema_compact
+    
     def to_openai_schema(self) -> Dict[str, Any]:
         """Convert to OpenAI function calling schema."""
         properties = {}
@@ -140,9 +232,85 @@ class ToolResult(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
 
+# Strings accepted as True for bool parameters (matched case-insensitively)
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+
+def _coerce_int(name: str, value: Any) -> int:
+    """Coerce a parameter value to int."""
+    if type(value) is int or isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        raise ToolValidationError(f"Parameter '{name}' must be integer")
+
+
+def _coerce_float(name: str, value: Any) -> Union[int, float]:
+    """Coerce a parameter value to float, leaving ints untouched."""
+    if type(value) is float or isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        raise ToolValidationError(f"Parameter '{name}' must be float")
+
+
+def _coerce_bool(name: str, value: Any) -> bool:
+    """Coerce a parameter value to bool, accepting common string spellings."""
+    if type(value) is bool:
+        return value
+    if isinstance(value, str):
+        return value in _TRUTHY or value.lower() in _TRUTHY
+    raise ToolValidationError(f"Parameter '{name}' must be boolean")
+
+
+def _as_lookup(values: List[Any]) -> Container[Any]:
+    """Return a frozenset for hashable enum values, else the list itself."""
+    try:
+        return frozenset(values)
+    except TypeError:
+        return values
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether a tool failure is transient and worth retrying.
+    
+    Timeouts, connection-level errors and 5xx responses are retried;
+    validation, configuration and client errors are not.
+    """
+    if isinstance(error, (asyncio.TimeoutError, httpx.TransportError)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return False
+
+
+def _passthrough(name: str, value: Any) -> Any:
+    """Accept a parameter value unchanged."""
+    return value
+
+
+# Parameter type -> coerce-or-raise step applied during input validation
+_TYPE_VALIDATORS: Dict[str, Callable[[str, Any], Any]] = {
+    "int": _coerce_int,
+    "float": _coerce_float,
+    "bool": _coerce_bool,
+    "str": _passthrough,
+    "list": _passthrough,
+    "dict": _passthrough,
+    "any": _passthrough,
+}
+
+
 class BaseTool(ABC):
     """Abstract base class for all tool implementations."""
     
+    # API tools against the same base URL share one connection pool; the
+    # client is closed when the last tool using it is cleaned up
+    _shared_clients: Dict[str, httpx.AsyncClient] = {}
+    _shared_client_refs: Dict[str, int] = {}
+    
     def __init__(self, config: ToolConfig) -> None:
         """Initialize tool with configuration.
         
@@ -150,21 +318,75 @@ class BaseTool(ABC):
             config: Tool configuration
         """
         self.config = config
-        self.status = ToolStatus.AVAILABLE
+        # Called with the tool whenever its status changes
+        self._status_listeners: List[Callable[["BaseTool"], None]] = []
+        self._status = ToolStatus.AVAILABLE
         self.usage_count = 0
         self.last_used: Optional[datetime] = None
         self.last_error: Optional[str] = None
         
+        # Parameter lookups, built from the schema on first validation
+        self._param_index: Optional[Dict[str, ToolParameter]] = None
+        self._required: FrozenSet[str] = frozenset()
+        self._enum_sets: Dict[str, Container[Any]] = {}
+        
+        # Metadata shared by every result of this tool
+        self._metadata_base = types.MappingProxyType({
+            "tool_type": config.tool_type.value,
+            "version": config.version
+        })
+        
         # Initialize HTTP client for API tools
         if config.tool_type == ToolType.API:
-            self._http_client = httpx.AsyncClient(
-                base_url=config.base_url,
-                headers=config.headers,
-                timeout=config.timeout_seconds
-            )
+            self._http_client = self._acquire_client(config.base_url)
         else:
             self._http_client = None
     
+    @classmethod
+    def _acquire_client(cls, base_url: Optional[str]) -> httpx.AsyncClient:
+        """Get the shared HTTP client for a base URL, creating it if needed.
+        
+        Headers and timeouts differ per tool, so they are sent per request
+        rather than configured on the shared client.
+        """
+        key = base_url or ""
+        client = cls._shared_clients.get(key)
+        if client is None or client.is_closed:
+            # Connection-level retries stay off; retries are the tool's decision
+            client = httpx.AsyncClient(
+                base_url=key,
+                follow_redirects=True,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=_HTTP2_AVAILABLE,
+                    limits=_HTTP_LIMITS,
+                    retries=0
+                )
+            )
+            cls._shared_clients[key] = client
+            cls._shared_client_refs[key] = 0
+        cls._shared_client_refs[key] += 1
+        return client
+    
+    @property
+    def status(self) -> ToolStatus:
+        """Current operational status."""
+        return self._status
+    
+    @status.setter
+    def status(self, value: ToolStatus) -> None:
+        """Set the status and notify listeners such as owning registries."""
+        self._status = value
+        for listener in self._status_listeners:
+            listener(self)
+    
+    async def __aenter__(self) -> "BaseTool":
+        """Use the tool as an async context manager."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Release tool resources on exit."""
+        await self.cleanup()
+    
     @property
     @abstractmethod
     def schema(self) -> ToolSchema:
@@ -192,7 +414,9 @@ class BaseTool(ABC):
         Returns:
             ToolResult containing execution outcome
         """
-        start_time = datetime.now(timezone.utc)
+        # perf_counter for the duration; the wall clock is read once for the result
+        start_time = time.perf_counter()
+        attempts = 0
         
         try:
             # Validate inputs if enabled
@@ -203,11 +427,23 @@ class BaseTool(ABC):
             if self.status != ToolStatus.AVAILABLE:
                 raise ToolExecutionError(f"Tool {self.config.name} is not available")
             
-            # Execute tool
-            result = await asyncio.wait_for(
-                self._execute(**kwargs),
-                timeout=self.config.timeout_seconds
-            )
+            # Execute tool, retrying transient failures with backoff
+            max_attempts = self.config.retry_attempts + 1
+            while True:
+                attempts += 1
+                try:
+                    async with asyncio.timeout(self.config.timeout_seconds):
+                        result = await self._execute(**kwargs)
+                    break
+                except Exception as e:
+                    if attempts >= max_attempts or not _is_retryable(e):
+                        if isinstance(e, TimeoutError):
+                            raise ToolExecutionError(
+                                f"Tool {self.config.name} timed out after "
+                                f"{self.config.timeout_seconds}s"
+                            ) from e
+                        raise
+                    await asyncio.sleep(min(2 ** (attempts - 1) * 0.1, 2.0))
             
             # Validate outputs if enabled
             if self.config.validate_outputs:
@@ -215,71 +451,86 @@ class BaseTool(ABC):
             
             # Update usage statistics
             self.usage_count += 1
-            self.last_used = datetime.now(timezone.utc)
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
+            now = datetime.now(timezone.utc)
+            self.last_used = now
             
-            return ToolResult(
+            # Every field is produced here, so skip validation; model_construct
+            # is only safe for internally built data like this
+            return ToolResult.model_construct(
                 success=True,
                 result=result,
                 execution_time=execution_time,
                 tool_name=self.config.name,
+                timestamp=now,
                 metadata={
+                    **self._metadata_base,
                     "usage_count": self.usage_count,
-                    "tool_type": self.config.tool_type,
-                    "version": self.config.version
+                    "attempts": attempts
                 }
             )
             
         except Exception as e:
             self.last_error = str(e)
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=False,
-                error=str(e),
+                error=self.last_error,
                 execution_time=execution_time,
                 tool_name=self.config.name,
+                timestamp=datetime.now(timezone.utc),
                 metadata={
+                    **self._metadata_base,
                     "error_type": type(e).__name__,
-                    "tool_type": self.config.tool_type
+                    "attempts": attempts
                 }
             )
     
+    def _index_parameters(self) -> None:
+        """Build parameter lookups from the tool schema.
+        
+        Schemas are fixed once a tool is constructed, so this only runs on the
+        first validation.
+        """
+        parameters = self.schema.parameters
+        self._param_index = {param.name: param for param in parameters}
+        self._required = frozenset(param.name for param in parameters if param.required)
+        self._enum_sets = {
+            param.name: _as_lookup(param.enum_values)
+            for param in parameters if param.enum_values
+        }
+    
     def _validate_inputs(self, kwargs: Dict[str, Any]) -> None:
         """Validate input parameters against schema."""
-        schema = self.schema
+        if self._param_index is None:
+            self._index_parameters()
+        
+        # Check required parameters, reporting the first missing one in schema order
+        missing = self._required - kwargs.keys()
+        if missing:
+            name = next(name for name in self._param_index if name in missing)
+            raise ToolValidationError(f"Required parameter '{name}' missing")
         
-        # Check required parameters
-        for param in schema.parameters:
-            if param.required and param.name not in kwargs:
-                raise ToolValidationError(f"Required parameter '{param.name}' missing")
+        for name, value in kwargs.items():
+            param = self._param_index.get(name)
+            if param is None:
+                continue
             
-            if param.name in kwargs:
-                value = kwargs[param.name]
-                
-                # Type validation (basic)
-                if param.type == "int" and not isinstance(value, int):
-                    try:
-                        kwargs[param.name] = int(value)
-                    except (ValueError, TypeError):
-                        raise ToolValidationError(f"Parameter '{param.name}' must be integer")
-                
-                elif param.type == "float" and not isinstance(value, (int, float)):
-                    try:
-                        kwargs[param.name] = float(value)
-                    except (ValueError, TypeError):
-                        raise ToolValidationError(f"Parameter '{param.name}' must be float")
-                
-                elif param.type == "bool" and not isinstance(value, bool):
-                    if isinstance(value, str):
-                        kwargs[param.name] = value.lower() in ("true", "1", "yes", "on")
-                    else:
-                        raise ToolValidationError(f"Parameter '{param.name}' must be boolean")
-                
-                # Enum validation
-                if param.enum_values and value not in param.enum_values:
+            # Type validation (basic)
+            value = kwargs[name] = _TYPE_VALIDATORS[param.type](name, value)
+            
+            # Enum validation
+            allowed = self._enum_sets.get(name)
+            if allowed is not None:
+                try:
+                    found = value in allowed
+                except TypeError:
+                    # Unhashable value (e.g. a dict for an "object" param)
+                    found = value in param.enum_values
+                if not found:
                     raise ToolValidationError(
-                        f"Parameter '{param.name}' must be one of {param.enum_values}"
+                        f"Parameter '{name}' must be one of {param.enum_values}"
                     )
     
     def _validate_outputs(self, result: Any) -> Any:
@@ -303,9 +554,75 @@ class BaseTool(ABC):
         }
     
     async def cleanup(self) -> None:
-        """Cleanup tool resources."""
-        if self._http_client:
-            await self._http_client.aclose()
+        """Cleanup tool resources.
+        
+        Releases this tool's reference to its shared HTTP client, closing the
+        client once no other tool uses it. Safe to call more than once.
+        """
+        client, self._http_client = self._http_client, None
+        if client is None:
+            return
+        
+        key = self.config.base_url or ""
+        if self._shared_clients.get(key) is client:
+            refs = self._shared_client_refs[key] - 1
+            if refs > 0:
+                self._shared_client_refs[key] = refs
+                return
+            del self._shared_clients[key]
+            del self._shared_client_refs[key]
+        await client.aclose()
+
+
+# Python annotation -> tool parameter type
+_ANNOTATION_MAP: Dict[Any, str] = {
+    str: "str",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    list: "list",
+    dict: "dict",
+}
+
+
+def _annotation_type(annotation: Any) -> str:
+    """Map a parameter annotation to a tool parameter type.
+    
+    ``Optional[T]`` maps like ``T`` and generics such as ``List[int]`` map by
+    their origin; anything else is ``"any"``.
+    """
+    try:
+        param_type = _ANNOTATION_MAP.get(annotation)
+    except TypeError:
+        return "any"
+    if param_type is not None:
+        return param_type
+    
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _annotation_type(args[0]) if len(args) == 1 else "any"
+    return _ANNOTATION_MAP.get(origin, "any")
+
+
+@functools.lru_cache(maxsize=256)
+def _signature_parameters(func: Callable) -> Tuple[ToolParameter, ...]:
+    """Infer tool parameters from a function signature, cached per function."""
+    parameters = []
+    
+    for name, param in inspect.signature(func).parameters.items():
+        required = param.default is inspect.Parameter.empty
+        
+        # Built from the signature, not user input, so validation is skipped
+        parameters.append(ToolParameter.model_construct(
+            name=name,
+            type=_annotation_type(param.annotation),
+            description=f"Parameter {name}",
+            required=required,
+            default=None if required else param.default
+        ))
+    
+    return tuple(parameters)
 
 
 class FunctionTool(BaseTool):
@@ -321,44 +638,30 @@ class FunctionTool(BaseTool):
         super().__init__(config)
         self.func = func
         self._schema = self._generate_schema()
+        
+        # Sync functions run on a bounded pool owned by this tool rather than
+        # the loop's shared default executor
+        self._is_coroutine = asyncio.iscoroutinefunction(func)
+        if self._is_coroutine:
+            self._executor = None
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=config.max_workers,
+                thread_name_prefix=f"tool-{config.name}"
+            )
     
     def _generate_schema(self) -> ToolSchema:
         """Generate schema from function signature."""
-        sig = inspect.signature(self.func)
-        parameters = []
-        
-        for name, param in sig.parameters.items():
-            param_type = "any"
-            required = param.default == inspect.Parameter.empty
-            default = None if required else param.default
-            
-            # Simple type inference
-            if param.annotation != inspect.Parameter.empty:
-                if param.annotation == str:
-                    param_type = "str"
-                elif param.annotation == int:
-                    param_type = "int"
-                elif param.annotation == float:
-                    param_type = "float"
-                elif param.annotation == bool:
-                    param_type = "bool"
-                elif param.annotation == list:
-                    param_type = "list"
-                elif param.annotation == dict:
-                    param_type = "dict"
-            
-            parameters.append(ToolParameter(
-                name=name,
-                type=param_type,
-                description=f"Parameter {name}",
-                required=required,
-                default=default
-            ))
+        try:
+            parameters = _signature_parameters(self.func)
+        except TypeError:
+            # Unhashable callables cannot be cached
+            parameters = _signature_parameters.__wrapped__(self.func)
         
-        return ToolSchema(
+        return ToolSchema.model_construct(
             name=self.config.name,
             description=self.config.description,
-            parameters=parameters
+            parameters=list(parameters)
         )
     
     @property
@@ -368,12 +671,86 @@ class FunctionTool(BaseTool):
     
     async def _execute(self, **kwargs) -> Any:
         """Execute the wrapped function."""
-        if asyncio.iscoroutinefunction(self.func):
+        if self._is_coroutine:
             return await self.func(**kwargs)
         else:
             # Run synchronous function in thread pool
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, lambda: self.func(**kwargs))
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(self.func, **kwargs)
+            )
+    
+    async def cleanup(self) -> None:
+        """Cleanup tool resources, stopping the worker threads."""
+        await super().cleanup()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class NumbaFunctionTool(FunctionTool):
+    """Function tool whose callable is a numba-compiled dispatcher.
+    
+    The schema is inferred from the original Python function, since the
+    compiled dispatcher does not carry its annotations.
+    """
+    
+    def __init__(
+        self,
+        config: ToolConfig,
+        func: Callable,
+        py_func: Callable,
+        warmup_args: Optional[Tuple[Any, ...]] = None
+    ) -> None:
+        """Initialize numba function tool.
+        
+        Args:
+            config: Tool configuration
+            func: Compiled numba dispatcher
+            py_func: Original Python function, used for the schema
+            warmup_args: Representative arguments used to trigger compilation
+        """
+        self.py_func = py_func
+        self.warmup_args = warmup_args
+        super().__init__(config, func)
+    
+    def _generate_schema(self) -> ToolSchema:
+        """Generate schema from the original function signature."""
+        return ToolSchema.model_construct(
+            name=self.config.name,
+            description=self.config.description,
+            parameters=list(_signature_parameters(self.py_func))
+        )
+    
+    async def warmup(self) -> None:
+        """Compile the function ahead of the first real call.
+        
+        Does nothing without warmup arguments; tools created with an explicit
+        signature are compiled eagerly anyway.
+        """
+        if self.warmup_args is None:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.func, *self.warmup_args)
+
+
+# Read size when streaming large API responses
+_STREAM_CHUNK_BYTES = 65536
+
+
+def _parse_response_body(body: Union[bytes, bytearray], encoding: Optional[str]) -> Any:
+    """Parse a response body as JSON, falling back to decoded text."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(body)
+        except _orjson.JSONDecodeError:
+            pass
+    else:
+        try:
+            return json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pass
+    
+    return body.decode(encoding or "utf-8", errors="replace")
 
 
 class APITool(BaseTool):
@@ -391,10 +768,23 @@ class APITool(BaseTool):
         
         if not config.base_url:
             raise ToolConfigurationError("API tool requires base_url in configuration")
+        
+        # The schema depends only on the frozen config
+        self._schema = self._build_schema()
+        
+        # Default headers, including authentication, are fixed with the config
+        self._authorization = f"Bearer {config.api_key}" if config.api_key else None
+        self._base_headers = dict(config.headers)
+        if self._authorization:
+            self._base_headers["Authorization"] = self._authorization
     
     @property
     def schema(self) -> ToolSchema:
         """Get API tool schema."""
+        return self._schema
+    
+    def _build_schema(self) -> ToolSchema:
+        """Build the API tool schema."""
         parameters = [
             ToolParameter(
                 name="endpoint",
@@ -438,28 +828,35 @@ class APITool(BaseTool):
         data = kwargs.get("data", {})
         headers = kwargs.get("headers", {})
         
-        # Merge with default headers
-        all_headers = {**self.config.headers, **headers}
-        
-        # Add authentication if configured
-        if self.config.api_key:
-            all_headers["Authorization"] = f"Bearer {self.config.api_key}"
+        # Merge with default headers; configured authentication always wins
+        if headers:
+            all_headers = {**self._base_headers, **headers}
+            if self._authorization:
+                all_headers["Authorization"] = self._authorization
+        else:
+            all_headers = self._base_headers
         
-        response = await self._http_client.request(
+        async with self._http_client.stream(
             method=self.method,
             url=endpoint,
             params=params,
             json=data if data else None,
-            headers=all_headers
-        )
-        
-        response.raise_for_status()
+            headers=all_headers,
+            timeout=self.config.timeout_seconds
+        ) as response:
+            response.raise_for_status()
+            
+            # Large bodies are accumulated in place rather than buffered as
+            # chunks and joined, keeping peak memory close to the body size
+            content_length = int(response.headers.get("content-length", 0))
+            if content_length > self.config.stream_threshold_bytes:
+                body = bytearray()
+                async for chunk in response.aiter_bytes(_STREAM_CHUNK_BYTES):
+                    body += chunk
+            else:
+                body = await response.aread()
         
-        # Try to parse JSON, fallback to text
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        return _parse_response_body(body, response.encoding)
 
 
 class ToolRegistry:
@@ -469,6 +866,12 @@ class ToolRegistry:
         """Initialize tool registry."""
         self._tools: Dict[str, BaseTool] = {}
         self._tool_groups: Dict[str, List[str]] = {}
+        # Tools whose status is AVAILABLE, kept in sync on status changes
+        self._available: Dict[str, BaseTool] = {}
+        # compact flag -> schemas of all available tools, in registration order
+        self._schema_cache: Dict[bool, List[Union[Dict[str, Any], bytes]]] = {}
+        # Tool name -> bound execute method, for single-lookup dispatch
+        self._dispatch: Dict[str, Callable[..., Awaitable[ToolResult]]] = {}
     
     def register(self, tool: BaseTool, group: Optional[str] = None) -> None:
         """Register a tool in the registry.
@@ -478,12 +881,43 @@ class ToolRegistry:
             group: Optional group name for categorization
         """
         self._tools[tool.config.name] = tool
+        self._dispatch[tool.config.name] = tool.execute
+        tool._status_listeners.append(self._on_status_change)
+        self._on_status_change(tool)
         
         if group:
             if group not in self._tool_groups:
                 self._tool_groups[group] = []
             self._tool_groups[group].append(tool.config.name)
     
+    def _on_status_change(self, tool: BaseTool) -> None:
+        """Keep the available-tools view in sync with a tool's status."""
+        name = tool.config.name
+        if self._tools.get(name) is not tool:
+            # Replaced by a later registration under the same name
+            return
+        
+        if tool.status == ToolStatus.AVAILABLE:
+            self._available[name] = tool
+        else:
+            self._available.pop(name, None)
+        self._schema_cache.clear()
+    
+    def set_status(self, name: str, status: ToolStatus) -> None:
+        """Change the status of a registered tool.
+        
+        Args:
+            name: Tool name
+            status: New tool status
+            
+        Raises:
+            ToolNotFoundError: If the tool is not registered
+        """
+        tool = self.get_tool(name)
+        if not tool:
+            raise ToolNotFoundError(f"Tool '{name}' not found in registry")
+        tool.status = status
+    
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """Get tool by name.
         
@@ -508,23 +942,41 @@ class ToolRegistry:
             return self._tool_groups[group]
         return list(self._tools.keys())
     
-    def get_schemas(self, group: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_schemas(
+        self,
+        group: Optional[str] = None,
+        compact: bool = False
+    ) -> List[Union[Dict[str, Any], bytes]]:
         """Get tool schemas for function calling.
         
         Args:
             group: Optional group to filter by
+            compact: Return minified JSON bytes instead of dicts
             
         Returns:
-            List of tool schemas in OpenAI format
+            List of tool schemas in OpenAI format; the schema dicts are shared
+            and must not be mutated
         """
-        tool_names = self.list_tools(group)
-        schemas = []
+        if group and group in self._tool_groups:
+            return self._collect_schemas(self._tool_groups[group], compact)
         
+        schemas = self._schema_cache.get(compact)
+        if schemas is None:
+            schemas = self._schema_cache[compact] = self._collect_schemas(self._tools, compact)
+        return schemas.copy()
+    
+    def _collect_schemas(
+        self,
+        tool_names: Iterable[str],
+        compact: bool
+    ) -> List[Union[Dict[str, Any], bytes]]:
+        """Collect schemas of the available tools among the given names."""
+        schemas = []
         for name in tool_names:
-            tool = self._tools[name]
-            if tool.status == ToolStatus.AVAILABLE:
-                schemas.append(tool.schema.to_openai_schema())
-        
+            tool = self._available.get(name)
+            if tool is not None:
+                schema = tool.schema
+                schemas.append(schema.openai_schema_compact if compact else schema.openai_schema)
         return schemas
     
     async def execute_tool(self, name: str, **kwargs) -> ToolResult:
@@ -537,23 +989,72 @@ class ToolRegistry:
         Returns:
             Tool execution result
         """
-        tool = self.get_tool(name)
-        if not tool:
+        execute = self._dispatch.get(name)
+        if execute is None:
             raise ToolNotFoundError(f"Tool '{name}' not found in registry")
         
-        return await tool.execute(**kwargs)
+        return await execute(**kwargs)
     
-    async def health_check(self) -> Dict[str, Any]:
-        """Perform health check on all tools."""
+    async def health_check(self, max_concurrency: int = 16) -> Dict[str, Any]:
+        """Perform health check on all tools concurrently.
+        
+        Args:
+            max_concurrency: Maximum number of checks in flight at once
+            
+        Returns:
+            Health report per tool name; a check that raised is reported with
+            status "error" instead of aborting the others
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def check(tool: BaseTool) -> Dict[str, Any]:
+            """Run one tool's health check under the concurrency bound."""
+            async with semaphore:
+                return await tool.health_check()
+        
+        names = list(self._tools)
+        reports = await asyncio.gather(
+            *(check(self._tools[name]) for name in names),
+            return_exceptions=True
+        )
+        
         results = {}
-        for name, tool in self._tools.items():
-            results[name] = await tool.health_check()
+        for name, report in zip(names, reports):
+            if isinstance(report, Exception):
+                report = {"tool_name": name, "status": ToolStatus.ERROR.value, "error": str(report)}
+            results[name] = report
         return results
     
-    async def cleanup(self) -> None:
-        """Cleanup all tools."""
-        for tool in self._tools.values():
-            await tool.cleanup()
+    async def warmup(self) -> None:
+        """Compile numba-backed tools ahead of their first call."""
+        await asyncio.gather(*(
+            tool.warmup() for tool in self._tools.values()
+            if isinstance(tool, NumbaFunctionTool)
+        ))
+    
+    async def cleanup(self, max_concurrency: int = 16) -> None:
+        """Cleanup all tools concurrently.
+        
+        Every tool is cleaned up even if some fail; the first failure is
+        re-raised afterwards.
+        
+        Args:
+            max_concurrency: Maximum number of cleanups in flight at once
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def release(tool: BaseTool) -> None:
+            """Clean up one tool under the concurrency bound."""
+            async with semaphore:
+                await tool.cleanup()
+        
+        outcomes = await asyncio.gather(
+            *(release(tool) for tool in self._tools.values()),
+            return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
 
 
 # Convenience functions for tool creation
@@ -612,6 +1113,55 @@ def create_api_tool(
     return APITool(config, method)
 
 
+def create_numba_function_tool(
+    name: str,
+    description: str,
+    func: Callable,
+    signature: Optional[Any] = None,
+    warmup_args: Optional[Tuple[Any, ...]] = None,
+    fastmath: bool = True,
+    **config_kwargs
+) -> NumbaFunctionTool:
+    """Create a function tool backed by a numba-compiled numeric function.
+    
+    Compilation happens on the first call unless a signature is given, which
+    adds noticeable cold-start latency; pass ``warmup_args`` and call
+    ``ToolRegistry.warmup`` at startup to pay that cost up front.
+    
+    Args:
+        name: Tool name
+        description: Tool description
+        func: Numeric Python function to compile in nopython mode
+        signature: Optional numba signature for eager compilation
+        warmup_args: Representative arguments used by ``warmup``
+        fastmath: Allow numba's fast floating-point optimizations
+        **config_kwargs: Additional configuration parameters
+        
+    Returns:
+        NumbaFunctionTool instance
+        
+    Raises:
+        ToolConfigurationError: If numba is not installed
+    """
+    if _numba is None:
+        raise ToolConfigurationError("numba is required for numba function tools")
+    
+    # nogil lets calls on the tool's worker threads run in parallel
+    options = {"cache": True, "fastmath": fastmath, "nogil": True}
+    if signature is not None:
+        compiled = _numba.njit(signature, **options)(func)
+    else:
+        compiled = _numba.njit(**options)(func)
+    
+    config = ToolConfig(
+        name=name,
+        description=description,
+        tool_type=ToolType.CALCULATOR,
+        **config_kwargs
+    )
+    return NumbaFunctionTool(config, compiled, func, warmup_args)
+
+
 # Custom Exceptions
 class ToolError(Exception):
     """Base exception for tool-related errors."""
@@ -4,16 +4,42 @@ This module provides working memory capabilities for agents to maintain
 context during task execution and conversation flows.
 """
 
+import copy
 import time
+import zlib
+import heapq
 import asyncio
-from collections import OrderedDict, defaultdict
-from typing import Dict, List, Optional, Any, Union, Tuple
-from datetime import datetime, timezone, timedelta
+import weakref
+import itertools
+from collections import defaultdict, deque
+from typing import Dict, List, Optional, Any, Union, Tuple, Set, Deque, Iterable
+from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
 from dataclasses import dataclass, field
 from enum import Enum
 
 from pydantic import BaseModel, Field
 
+# zstandard is optional; zlib from the standard library is the fallback codec
+try:
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - optional dependency
+    _zstd = None
+
+
+def _compress(data: bytes) -> bytes:
+    """Compress a content payload with zstd, or zlib when it is unavailable."""
+    if _zstd is not None:
+        return _zstd.compress(data)
+    return zlib.compress(data)
+
+
+def _decompress(data: bytes) -> bytes:
+    """Invert ``_compress``."""
+    if _zstd is not None:
+        return _zstd.decompress(data)
+    return zlib.decompress(data)
+
 
 class MemoryItemType(str, Enum):
     """Types of memory items."""
@@ -36,39 +62,129 @@ class MemoryPriority(int, Enum):
     CRITICAL = 15
 
 
-@dataclass
+# Shared by items stored without tags, so those stores do not allocate an
+# empty list each
+_EMPTY_TAGS: Tuple[str, ...] = ()
+
+
+def _freeze_tags(tags: Iterable[str]) -> Tuple[str, ...]:
+    """Return tags as a tuple, sharing the empty one."""
+    return tuple(tags) or _EMPTY_TAGS
+
+
+@dataclass(slots=True)
 class MemoryItem:
-    """Individual memory item with metadata."""
+    """Individual memory item with metadata.
+    
+    ``timestamp`` and ``last_accessed`` are ``time.monotonic()`` readings;
+    use ``created_at`` for a wall-clock datetime. ``tags`` is kept as a
+    tuple; change it through ``ShortTermMemory.update`` so the tag index
+    follows. ``metadata`` is the item's own dict, copied by ``store``.
+    """
     
     id: str
     content: Any
     item_type: MemoryItemType
     priority: "MemoryPriority" = MemoryPriority.NORMAL
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: float = field(default_factory=time.monotonic)
     ttl_seconds: Optional[int] = None
     access_count: int = 0
-    last_accessed: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    tags: List[str] = field(default_factory=list)
+    last_accessed: float = field(default_factory=time.monotonic)
+    tags: Tuple[str, ...] = _EMPTY_TAGS
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Lowercased content, tags and metadata values that search() scans; the
+    # content is the first _content_len characters
+    _search_blob: str = field(default="", init=False, repr=False, compare=False)
+    _content_len: int = field(default=0, init=False, repr=False, compare=False)
+    # priority.value as a plain int for sort keys; kept in sync by update()
+    priority_value: int = field(default=0, init=False, repr=False, compare=False)
+    # Set to "str" or "bytes" while content holds a compressed payload
+    _compressed: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        if type(self.tags) is not tuple:
+            self.tags = _freeze_tags(self.tags)
+        if type(self.metadata) is not dict:
+            self.metadata = dict(self.metadata)
+        self.priority_value = self.priority.value
+        self._refresh_search_blob()
+    
+    def _refresh_search_blob(self) -> None:
+        """Rebuild the search text after content, tags or metadata change.
+        
+        Fields are joined with a unit separator so a query cannot match
+        across the boundary between two of them. Compressed content is left
+        out, so the blob does not keep a full-size copy of it; search()
+        decompresses such items instead.
+        """
+        content = "" if self._compressed is not None else str(self.content).lower()
+        rest = "\x1f".join((*self.tags, *map(str, self.metadata.values()))).lower()
+        self._content_len = len(content)
+        self._search_blob = f"{content}\x1f{rest}"
     
     @property
     def is_expired(self) -> bool:
         """Check if memory item has expired."""
+        return self.is_expired_at(time.monotonic())
+    
+    def is_expired_at(self, now: float) -> bool:
+        """Check expiry against a monotonic time read once by the caller."""
         if self.ttl_seconds is None:
             return False
-        
-        elapsed = (datetime.now(timezone.utc) - self.timestamp).total_seconds()
-        return elapsed > self.ttl_seconds
+        return now - self.timestamp > self.ttl_seconds
+    
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Monotonic time after which the item is expired, if it has a TTL."""
+        if self.ttl_seconds is None:
+            return None
+        return self.timestamp + self.ttl_seconds
     
     @property
     def age_seconds(self) -> float:
         """Get age of memory item in seconds."""
-        return (datetime.now(timezone.utc) - self.timestamp).total_seconds()
+        return time.monotonic() - self.timestamp
+    
+    @property
+    def created_at(self) -> datetime:
+        """Wall-clock time at which the item was stored."""
+        return datetime.fromtimestamp(time.time() - self.age_seconds, timezone.utc)
     
     def access(self) -> None:
         """Mark item as accessed."""
         self.access_count += 1
-        self.last_accessed = datetime.now(timezone.utc)
+        self.last_accessed = time.monotonic()
+
+
+def _plain_content(item: MemoryItem) -> Any:
+    """Return an item's content, decompressing it if needed."""
+    if item._compressed is None:
+        return item.content
+    data = _decompress(item.content)
+    return data.decode() if item._compressed == "str" else data
+
+
+def _reveal(item: MemoryItem) -> MemoryItem:
+    """Return the item itself, or a copy holding decompressed content."""
+    if item._compressed is None:
+        return item
+    plain = copy.copy(item)
+    plain.content = _plain_content(item)
+    plain._compressed = None
+    return plain
+
+
+def _discard_from_index(index: Dict[Any, Set[str]], key: Any, item_id: str) -> None:
+    """Remove an id from an index bucket, dropping the bucket once empty."""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.discard(item_id)
+        if not bucket:
+            del index[key]
+
+
+# Sort key ordering items by priority, then by creation time
+_priority_recency_key = attrgetter("priority_value", "timestamp")
 
 
 class ShortTermMemory:
@@ -78,6 +194,9 @@ class ShortTermMemory:
     priority-based retention, and efficient retrieval mechanisms.
     """
     
+    # str/bytes content longer than this is compressed when enabled
+    _compress_threshold = 4096
+    
     def __init__(
         self,
         capacity: int = 1000,
@@ -91,40 +210,71 @@ class ShortTermMemory:
             capacity: Maximum number of items to store
             default_ttl_seconds: Default TTL for items
             cleanup_interval_seconds: Interval for automatic cleanup
-            enable_compression: Enable memory compression
+            enable_compression: Compress large str/bytes content; items are
+                handed back with their content decompressed
         """
         self.capacity = capacity
         self.default_ttl_seconds = default_ttl_seconds
         self.cleanup_interval_seconds = cleanup_interval_seconds
         self.enable_compression = enable_compression
         
-        # Storage
-        self._items: OrderedDict[str, MemoryItem] = OrderedDict()
-        self._type_index: Dict[MemoryItemType, List[str]] = defaultdict(list)
-        self._tag_index: Dict[str, List[str]] = defaultdict(list)
-        self._priority_queues: Dict[MemoryPriority, List[str]] = defaultdict(list)
+        # Storage; dict order is LRU order (oldest first), and the indexes
+        # are sets so removals stay O(1) per bucket
+        self._items: Dict[str, MemoryItem] = {}
+        self._type_index: Dict[MemoryItemType, Set[str]] = defaultdict(set)
+        self._tag_index: Dict[str, Set[str]] = defaultdict(set)
+        self._priority_queues: Dict[MemoryPriority, Set[str]] = defaultdict(set)
+        # (expires_at, item_id) min-heap; entries for removed or re-stored
+        # items are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
         
         # Statistics
         self._access_count = 0
         self._hit_count = 0
         self._eviction_count = 0
-        self._last_cleanup = datetime.now(timezone.utc)
+        # Wall-clock float; formatted by get_statistics, then cached
+        self._last_cleanup = time.time()
+        self._last_cleanup_iso: Optional[str] = None
         
-        # Background cleanup task
+        # Background cleanup task; it idles on _has_items while memory is empty
+        self._has_items = asyncio.Event()
         self._cleanup_task: Optional[asyncio.Task] = None
         self._start_cleanup_task()
     
     def _start_cleanup_task(self) -> None:
-        """Start background cleanup task."""
+        """Start background cleanup task.
+        
+        The task only holds a weak reference to the memory, and is cancelled
+        when the memory is garbage collected even if ``shutdown()`` was never
+        called.
+        """
         if self._cleanup_task is None or self._cleanup_task.done():
-            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+            self._cleanup_task = asyncio.create_task(
+                self._cleanup_loop(weakref.ref(self))
+            )
+            weakref.finalize(self, self._cleanup_task.cancel)
     
-    async def _cleanup_loop(self) -> None:
+    @staticmethod
+    async def _cleanup_loop(memory_ref: "weakref.ReferenceType[ShortTermMemory]") -> None:
         """Background cleanup loop."""
         while True:
             try:
-                await asyncio.sleep(self.cleanup_interval_seconds)
-                await self._cleanup_expired()
+                # Only hold the memory while touching it, never across a wait
+                memory = memory_ref()
+                if memory is None:
+                    break
+                has_items = memory._has_items
+                interval = memory.cleanup_interval_seconds
+                del memory
+                
+                await has_items.wait()
+                await asyncio.sleep(interval)
+                
+                memory = memory_ref()
+                if memory is None:
+                    break
+                await memory._cleanup_expired()
+                del memory
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -156,33 +306,46 @@ class ShortTermMemory:
             True if stored successfully
         """
         # Remove existing item if present
-        if item_id in self._items:
-            await self._remove_item(item_id)
+        existing = self._items.pop(item_id, None)
+        if existing is not None:
+            self._unindex(existing)
         
         # Check capacity and evict if necessary
         if len(self._items) >= self.capacity:
             await self._evict_items()
         
         # Create memory item
+        # One clock read serves as both creation and last access time
+        now = time.monotonic()
         item = MemoryItem(
             id=item_id,
             content=content,
             item_type=item_type,
             priority=priority,
+            timestamp=now,
             ttl_seconds=ttl_seconds or self.default_ttl_seconds,
-            tags=tags or [],
-            metadata=metadata or {}
+            last_accessed=now,
+            tags=tags or _EMPTY_TAGS,
+            metadata=dict(metadata) if metadata else {}
         )
+        self._maybe_compress(item)
         
-        # Store item
+        # Store item; any previous entry was removed, so this appends
         self._items[item_id] = item
-        self._items.move_to_end(item_id)
+        self._has_items.set()
         
         # Update indexes
-        self._type_index[item_type].append(item_id)
+        self._type_index[item_type].add(item_id)
         for tag in item.tags:
-            self._tag_index[tag].append(item_id)
-        self._priority_queues[priority].append(item_id)
+            self._tag_index[tag].add(item_id)
+        self._priority_queues[priority].add(item_id)
+        
+        expires_at = item.expires_at
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, item_id))
+            # Drop stale entries once they outnumber the live items
+            if len(self._expiry_heap) > 2 * self.capacity:
+                self._rebuild_expiry_heap()
         
         return True
     
@@ -202,23 +365,28 @@ class ShortTermMemory:
         """
         self._access_count += 1
         
-        item = self._items.get(item_id)
+        # An accessed item is popped and re-inserted to move it to the end
+        # (most recently used); a peek leaves the LRU order alone
+        items = self._items
+        item = items.pop(item_id, None) if mark_accessed else items.get(item_id)
         if item is None:
             return None
         
         # Check if expired
         if item.is_expired:
-            await self._remove_item(item_id)
+            if mark_accessed:
+                self._unindex(item)
+            else:
+                await self._remove_item(item_id)
             return None
         
         self._hit_count += 1
         
         if mark_accessed:
             item.access()
-            # Move to end (most recently used)
-            self._items.move_to_end(item_id)
+            items[item_id] = item
         
-        return item
+        return _reveal(item)
     
     async def retrieve_by_type(
         self,
@@ -234,21 +402,7 @@ class ShortTermMemory:
         Returns:
             List of memory items
         """
-        item_ids = self._type_index.get(item_type, [])
-        items = []
-        
-        for item_id in item_ids:
-            item = await self.retrieve(item_id, mark_accessed=False)
-            if item is not None:
-                items.append(item)
-        
-        # Sort by priority and timestamp
-        items.sort(key=lambda x: (x.priority.value, x.timestamp), reverse=True)
-        
-        if limit:
-            items = items[:limit]
-        
-        return items
+        return self._collect_live(self._type_index.get(item_type, ()), limit)
     
     async def retrieve_by_tags(
         self,
@@ -269,28 +423,41 @@ class ShortTermMemory:
         if not tags:
             return []
         
-        item_sets = [set(self._tag_index.get(tag, [])) for tag in tags]
+        if len(tags) == 1:
+            # AND and OR agree for one tag; the bucket is read in place
+            return self._collect_live(self._tag_index.get(tags[0], ()), limit)
+        
+        item_sets = [self._tag_index.get(tag, set()) for tag in tags]
         
         if match_all:
             # Intersection of all tag sets
-            matching_ids = set.intersection(*item_sets) if item_sets else set()
+            matching_ids = set.intersection(*item_sets)
         else:
             # Union of all tag sets
-            matching_ids = set.union(*item_sets) if item_sets else set()
+            matching_ids = set.union(*item_sets)
         
-        items = []
-        for item_id in matching_ids:
-            item = await self.retrieve(item_id, mark_accessed=False)
-            if item is not None:
-                items.append(item)
+        return self._collect_live(matching_ids, limit)
+    
+    def _collect_live(self, item_ids: Iterable[str], limit: Optional[int]) -> List[MemoryItem]:
+        """Fetch unexpired items for index ids, highest priority and newest first.
         
-        # Sort by priority and timestamp
-        items.sort(key=lambda x: (x.priority.value, x.timestamp), reverse=True)
+        Reads the store directly rather than through ``retrieve``: index
+        lookups are not counted as accesses, and expired items are skipped
+        here and left for the cleanup pass.
+        """
+        now = time.monotonic()
+        items = self._items
+        live = [
+            item for item in map(items.get, item_ids)
+            if item is not None and not item.is_expired_at(now)
+        ]
         
+        # Sort by priority and timestamp
         if limit:
-            items = items[:limit]
-        
-        return items
+            live = heapq.nlargest(limit, live, key=_priority_recency_key)
+        else:
+            live.sort(key=_priority_recency_key, reverse=True)
+        return [_reveal(item) for item in live]
     
     async def search(
         self,
@@ -309,58 +476,56 @@ class ShortTermMemory:
             List of matching memory items
         """
         query_lower = query.lower()
-        matching_items = []
+        query_len = len(query_lower)
+        scored: List[Tuple[float, MemoryItem]] = []
+        now = time.monotonic()
         
         for item in self._items.values():
-            if item.is_expired:
+            if item.is_expired_at(now):
                 continue
             
             if item_types and item.item_type not in item_types:
                 continue
             
-            # Simple text search in content
-            content_str = str(item.content).lower()
-            if query_lower in content_str:
-                matching_items.append(item)
-                continue
-            
-            # Search in tags
-            if any(query_lower in tag.lower() for tag in item.tags):
-                matching_items.append(item)
-                continue
-            
-            # Search in metadata
-            metadata_str = str(item.metadata).lower()
-            if query_lower in metadata_str:
-                matching_items.append(item)
-        
-        # Sort by relevance (simple scoring)
-        def relevance_score(item: MemoryItem) -> float:
-            score = 0.0
-            content_str = str(item.content).lower()
-            
-            # Exact match bonus
-            if query_lower == content_str:
-                score += 10.0
-            
-            # Count occurrences
-            score += content_str.count(query_lower) * 2.0
+            # Simple text search in content, tags and metadata
+            blob = item._search_blob
+            if item._compressed is None:
+                if query_lower not in blob:
+                    continue
+                
+                # Relevance is scored in the same pass, on the content prefix
+                content_len = item._content_len
+                score = blob.count(query_lower, 0, content_len) * 2.0
+                
+                # Exact match bonus
+                if content_len == query_len and blob.startswith(query_lower):
+                    score += 10.0
+            else:
+                # Compressed content is not in the blob
+                content = str(_plain_content(item)).lower()
+                if query_lower not in content and query_lower not in blob:
+                    continue
+                
+                score = content.count(query_lower) * 2.0
+                if content == query_lower:
+                    score += 10.0
             
             # Priority bonus
-            score += item.priority.value * 0.1
+            score += item.priority_value * 0.1
             
             # Recency bonus
-            age_hours = item.age_seconds / 3600
+            age_hours = (now - item.timestamp) / 3600
             score += max(0, 5.0 - age_hours * 0.1)
             
-            return score
-        
-        matching_items.sort(key=relevance_score, reverse=True)
+            scored.append((score, item))
         
+        # Sort by relevance; nlargest keeps ties in store order like a stable sort
         if limit:
-            matching_items = matching_items[:limit]
+            ranked = heapq.nlargest(limit, scored, key=itemgetter(0))
+        else:
+            ranked = sorted(scored, key=itemgetter(0), reverse=True)
         
-        return matching_items
+        return [_reveal(item) for _, item in ranked]
     
     async def update(
         self,
@@ -387,40 +552,66 @@ class ShortTermMemory:
             return False
         
         # Update indexes if needed
+        if tags is not None:
+            tags = _freeze_tags(tags)
         if tags is not None and tags != item.tags:
             # Remove from old tag indexes
             for tag in item.tags:
-                if item_id in self._tag_index[tag]:
-                    self._tag_index[tag].remove(item_id)
+                _discard_from_index(self._tag_index, tag, item_id)
             
             # Add to new tag indexes
             for tag in tags:
-                self._tag_index[tag].append(item_id)
+                self._tag_index[tag].add(item_id)
             
             item.tags = tags
         
         if priority is not None and priority != item.priority:
             # Remove from old priority queue
-            if item_id in self._priority_queues[item.priority]:
-                self._priority_queues[item.priority].remove(item_id)
+            _discard_from_index(self._priority_queues, item.priority, item_id)
             
             # Add to new priority queue
-            self._priority_queues[priority].append(item_id)
+            self._priority_queues[priority].add(item_id)
             item.priority = priority
+            item.priority_value = priority.value
         
         # Update content and metadata
         if content is not None:
             item.content = content
+            item._compressed = None
         
         if metadata is not None:
             item.metadata.update(metadata)
         
+        # Compress first so the blob is built without compressed content
+        if content is not None:
+            self._maybe_compress(item)
+        
+        if content is not None or tags is not None or metadata is not None:
+            item._refresh_search_blob()
+        
         # Mark as accessed
         item.access()
-        self._items.move_to_end(item_id)
+        self._items[item_id] = self._items.pop(item_id)
         
         return True
     
+    def _maybe_compress(self, item: MemoryItem) -> None:
+        """Compress an item's content in place if it is large enough."""
+        content = item.content
+        if (
+            self.enable_compression
+            and isinstance(content, (str, bytes))
+            and len(content) > self._compress_threshold
+        ):
+            if isinstance(content, str):
+                item.content = _compress(content.encode())
+                item._compressed = "str"
+            else:
+                item.content = _compress(content)
+                item._compressed = "bytes"
+            # Rebuild without the content now that it is compressed
+            item._refresh_search_blob()
+    
     async def remove(self, item_id: str) -> bool:
         """Remove an item from memory.
         
@@ -434,20 +625,62 @@ class ShortTermMemory:
     
     async def _remove_item(self, item_id: str) -> bool:
         """Internal method to remove an item."""
-        item = self._items.get(item_id)
+        # Remove from main storage
+        item = self._items.pop(item_id, None)
         if item is None:
             return False
         
-        # Remove from main storage
-        del self._items[item_id]
+        self._unindex(item)
+        return True
+    
+    def _remove_many(self, item_ids: Iterable[str]) -> int:
+        """Remove several items, updating each index bucket once.
         
-        # Remove from indexes
-        self._type_index[item.item_type].remove(item_id)
-        for tag in item.tags:
-            self._tag_index[tag].remove(item_id)
-        self._priority_queues[item.priority].remove(item_id)
+        Returns:
+            Number of items removed
+        """
+        items = self._items
+        by_type: Dict[MemoryItemType, Set[str]] = defaultdict(set)
+        by_tag: Dict[str, Set[str]] = defaultdict(set)
+        by_priority: Dict[MemoryPriority, Set[str]] = defaultdict(set)
         
-        return True
+        removed = 0
+        for item_id in item_ids:
+            item = items.pop(item_id, None)
+            if item is None:
+                continue
+            removed += 1
+            by_type[item.item_type].add(item_id)
+            for tag in item.tags:
+                by_tag[tag].add(item_id)
+            by_priority[item.priority].add(item_id)
+        
+        for index, removals in (
+            (self._type_index, by_type),
+            (self._tag_index, by_tag),
+            (self._priority_queues, by_priority),
+        ):
+            for key, ids in removals.items():
+                bucket = index.get(key)
+                if bucket is not None:
+                    bucket -= ids
+                    if not bucket:
+                        del index[key]
+        
+        if not items:
+            self._has_items.clear()
+        return removed
+    
+    def _unindex(self, item: MemoryItem) -> None:
+        """Drop an item already popped from storage out of the indexes."""
+        if not self._items:
+            self._has_items.clear()
+        
+        item_id = item.id
+        _discard_from_index(self._type_index, item.item_type, item_id)
+        for tag in item.tags:
+            _discard_from_index(self._tag_index, tag, item_id)
+        _discard_from_index(self._priority_queues, item.priority, item_id)
     
     async def _evict_items(self, target_size: Optional[int] = None) -> int:
         """Evict items to make space.
@@ -461,30 +694,19 @@ class ShortTermMemory:
         if target_size is None:
             target_size = int(self.capacity * 0.8)  # Evict to 80% capacity
         
-        evicted_count = 0
-        current_size = len(self._items)
-        
         # First, remove expired items
-        expired_items = [
-            item_id for item_id, item in self._items.items()
-            if item.is_expired
-        ]
-        for item_id in expired_items:
-            await self._remove_item(item_id)
-            evicted_count += 1
-        
-        # If still over capacity, use LRU eviction with priority consideration
-        items_list = list(self._items.items())
-        while len(self._items) > target_size and items_list:
-            # Sort by priority (ascending) and last accessed (ascending)
-            items_list.sort(
-                key=lambda x: (x[1].priority.value, x[1].last_accessed)
+        evicted_count = self._remove_many(self._pop_expired(time.monotonic()))
+        
+        # If still over capacity, use LRU eviction with priority consideration:
+        # the lowest priority, least recently used items go in one batch
+        excess = len(self._items) - target_size
+        if excess > 0:
+            victims = heapq.nsmallest(
+                excess,
+                ((item.priority_value, item.last_accessed, item_id)
+                 for item_id, item in self._items.items())
             )
-            
-            # Remove lowest priority, least recently used item
-            item_id, _ = items_list.pop(0)
-            await self._remove_item(item_id)
-            evicted_count += 1
+            evicted_count += self._remove_many(item_id for _, _, item_id in victims)
         
         self._eviction_count += evicted_count
         return evicted_count
@@ -495,25 +717,68 @@ class ShortTermMemory:
         Returns:
             Number of items cleaned up
         """
-        expired_items = [
-            item_id for item_id, item in self._items.items()
-            if item.is_expired
-        ]
+        cleanup_count = self._remove_many(self._pop_expired(time.monotonic()))
         
-        cleanup_count = 0
-        for item_id in expired_items:
-            await self._remove_item(item_id)
-            cleanup_count += 1
-        
-        self._last_cleanup = datetime.now(timezone.utc)
+        self._last_cleanup = time.time()
+        self._last_cleanup_iso = None
         return cleanup_count
     
+    def _pop_expired(self, now: float) -> List[str]:
+        """Pop the ids of items expired at ``now`` off the expiry heap.
+        
+        Only entries that are due are touched, so the cost is proportional to
+        the number of expired items rather than to the size of the store.
+        """
+        heap = self._expiry_heap
+        items = self._items
+        expired = []
+        while heap and heap[0][0] < now:
+            expires_at, item_id = heapq.heappop(heap)
+            item = items.get(item_id)
+            # Skip entries left behind by removed or re-stored items
+            if item is not None and item.expires_at == expires_at and item.is_expired_at(now):
+                expired.append(item_id)
+        return expired
+    
+    def _count_expired(self, now: float) -> int:
+        """Count items expired at ``now`` without removing them.
+        
+        Walks only the part of the expiry heap that is already due: a node
+        that is not due cannot have due children.
+        """
+        heap = self._expiry_heap
+        items = self._items
+        size = len(heap)
+        count = 0
+        pending = [0] if heap else []
+        while pending:
+            index = pending.pop()
+            expires_at, item_id = heap[index]
+            if expires_at >= now:
+                continue
+            item = items.get(item_id)
+            if item is not None and item.expires_at == expires_at and item.is_expired_at(now):
+                count += 1
+            pending.extend(child for child in (2 * index + 1, 2 * index + 2) if child < size)
+        return count
+    
+    def _rebuild_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from the live items."""
+        self._expiry_heap = [
+            (item.expires_at, item_id)
+            for item_id, item in self._items.items()
+            if item.ttl_seconds is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+    
     async def clear(self) -> None:
         """Clear all memory items."""
         self._items.clear()
         self._type_index.clear()
         self._tag_index.clear()
         self._priority_queues.clear()
+        self._expiry_heap.clear()
+        self._has_items.clear()
     
     async def get_statistics(self) -> Dict[str, Any]:
         """Get memory statistics.
@@ -522,7 +787,8 @@ class ShortTermMemory:
             Dictionary containing memory statistics
         """
         total_items = len(self._items)
-        expired_items = sum(1 for item in self._items.values() if item.is_expired)
+        now = time.monotonic()
+        expired_items = self._count_expired(now)
         
         hit_rate = (self._hit_count / self._access_count) if self._access_count > 0 else 0.0
         
@@ -545,12 +811,20 @@ class ShortTermMemory:
             "hit_count": self._hit_count,
             "hit_rate": hit_rate,
             "eviction_count": self._eviction_count,
-            "last_cleanup": self._last_cleanup.isoformat(),
+            "last_cleanup": self._last_cleanup_isoformat(),
             "type_distribution": type_distribution,
             "priority_distribution": priority_distribution,
             "memory_usage_mb": self._estimate_memory_usage()
         }
     
+    def _last_cleanup_isoformat(self) -> str:
+        """Return the last cleanup time as an ISO string, formatting it once."""
+        if self._last_cleanup_iso is None:
+            self._last_cleanup_iso = datetime.fromtimestamp(
+                self._last_cleanup, timezone.utc
+            ).isoformat()
+        return self._last_cleanup_iso
+    
     def _estimate_memory_usage(self) -> float:
         """Estimate memory usage in MB (rough approximation)."""
         import sys
@@ -558,6 +832,7 @@ class ShortTermMemory:
         total_size = 0
         for item in self._items.values():
             total_size += sys.getsizeof(item.content)
+            total_size += sys.getsizeof(item._search_blob)
             total_size += sys.getsizeof(item.metadata)
             total_size += sum(sys.getsizeof(tag) for tag in item.tags)
         
@@ -586,11 +861,14 @@ class WorkingMemory(ShortTermMemory):
         """Initialize working memory."""
         super().__init__(**kwargs)
         
-        # Task-specific storage
-        self._conversation_history: List[Dict[str, Any]] = []
+        # Task-specific storage; histories are bounded like the item store
+        self._conversation_history: Deque[Dict[str, Any]] = deque(maxlen=self.capacity)
         self._task_context: Dict[str, Any] = {}
         self._active_tools: Dict[str, Any] = {}
-        self._reasoning_steps: List[Dict[str, Any]] = []
+        self._reasoning_steps: Deque[Dict[str, Any]] = deque(maxlen=self.capacity)
+        # Ids come from counters so they stay unique once old entries drop off
+        self._turn_counter = 0
+        self._step_counter = 0
     
     async def add_conversation_turn(
         self,
@@ -608,7 +886,8 @@ class WorkingMemory(ShortTermMemory):
         Returns:
             Turn identifier
         """
-        turn_id = f"turn_{len(self._conversation_history)}"
+        turn_id = f"turn_{self._turn_counter}"
+        self._turn_counter += 1
         turn = {
             "id": turn_id,
             "role": role,
@@ -642,10 +921,12 @@ class WorkingMemory(ShortTermMemory):
         Returns:
             List of conversation turns
         """
-        history = self._conversation_history.copy()
         if limit:
-            history = history[-limit:]
-        return history
+            # Walk back from the newest turn instead of copying the whole history
+            history = list(itertools.islice(reversed(self._conversation_history), limit))
+            history.reverse()
+            return history
+        return list(self._conversation_history)
     
     async def set_task_context(self, key: str, value: Any) -> None:
         """Set task context variable.
@@ -695,7 +976,8 @@ class WorkingMemory(ShortTermMemory):
         Returns:
             Step identifier
         """
-        step_id = f"step_{len(self._reasoning_steps)}"
+        step_id = f"step_{self._step_counter}"
+        self._step_counter += 1
         step = {
             "id": step_id,
             "type": step_type,
@@ -729,10 +1011,9 @@ class WorkingMemory(ShortTermMemory):
         Returns:
             List of reasoning steps
         """
-        steps = self._reasoning_steps.copy()
         if step_type:
-            steps = [step for step in steps if step["type"] == step_type]
-        return steps
+            return [step for step in self._reasoning_steps if step["type"] == step_type]
+        return list(self._reasoning_steps)
     
     async def register_active_tool(
         self,
@@ -769,15 +1050,17 @@ class WorkingMemory(ShortTermMemory):
         self._task_context.clear()
         self._active_tools.clear()
         self._reasoning_steps.clear()
+        self._turn_counter = 0
+        self._step_counter = 0
         
-        # Remove task-related items from memory
-        task_items = await self.retrieve_by_tags(
-            ["conversation", "task_context", "reasoning", "active_tool"],
-            match_all=False
-        )
+        # Remove task-related items from memory, expired ones included,
+        # straight from the tag index
+        tag_index = self._tag_index
+        task_ids: Set[str] = set()
+        for tag in ("conversation", "task_context", "reasoning", "active_tool"):
+            task_ids |= tag_index.get(tag, set())
         
-        for item in task_items:
-            await self.remove(item.id)
+        self._remove_many(task_ids)
     
     async def get_working_summary(self) -> Dict[str, Any]:
         """Get a summary of working memory state.